@@ -4,12 +4,13 @@
 import os
 import sys
 import unittest
-
-os.environ["FOREST_TYPE"] = "memory"
+from unittest import mock
 
 if __name__ == "__main__":
-    loader = unittest.TestLoader()
-    suite = loader.discover("tests", pattern="test_*.py")
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Scope the backend selection to the test run instead of mutating the process environment
+    with mock.patch.dict(os.environ, {"FOREST_TYPE": "memory"}):
+        loader = unittest.TestLoader()
+        suite = loader.discover("tests", pattern="test_*.py")
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
     sys.exit(0 if result.wasSuccessful() else 1)
@@ -5,6 +5,7 @@ cache backend.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
@@ -100,8 +101,14 @@ def test_s3_raw_to_derived():
 
 def main():
     """Execute all integration tests."""
-    test_s3_unique_project_names()
-    test_s3_unique_subject_ids()
+    # The unique-value lookups are independent network reads, run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(test_s3_unique_project_names),
+            executor.submit(test_s3_unique_subject_ids),
+        ]
+        for future in futures:
+            future.result()
     test_s3_asset_basics()
     test_s3_source_data()
     test_s3_raw_to_derived()
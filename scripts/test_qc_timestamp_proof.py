@@ -2,13 +2,14 @@
 
 import os
 import unittest
-
-os.environ["FOREST_TYPE"] = "s3"
+from unittest import mock
 
 import duckdb
 
-from zombie_squirrel import qc
-from zombie_squirrel.acorns import TREE
+# The Tree backend is chosen when zombie_squirrel.acorns is first imported
+with mock.patch.dict(os.environ, {"FOREST_TYPE": "s3"}):
+    from zombie_squirrel import qc
+    from zombie_squirrel.acorns import TREE
 
 SUBJECT_ID = "818323"
 BUCKET = "allen-data-views"
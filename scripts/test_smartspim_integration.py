@@ -5,15 +5,15 @@ resulting DataFrame for manual inspection.
 """
 
 import os
+from unittest import mock
 
 import pandas as pd
 
-os.environ["FOREST_TYPE"] = "memory"
-
-from zombie_squirrel.acorn_helpers.assets_smartspim import (  # noqa: E402
-    _build_rows,
-    _fetch_asset_metadata,
-)
+with mock.patch.dict(os.environ, {"FOREST_TYPE": "memory"}):
+    from zombie_squirrel.acorn_helpers.assets_smartspim import (
+        _build_rows,
+        _fetch_asset_metadata,
+    )
 
 EXAMPLE_RAW = "SmartSPIM_828521_2026-03-03_04-49-46"
 EXAMPLE_STITCHED = "SmartSPIM_828521_2026-03-03_04-49-46_stitched_2026-03-05_10-26-24"
@@ -4,6 +4,9 @@ Provides functions to fetch and cache project names, subject IDs, and asset
 metadata from the AIND metadata database with support for multiple backends.
 Also exposes get_squirrel_info to retrieve the squirrel.json registry of all
 available acorns and their metadata.
+
+Importing the package imports every acorn helper, which registers each acorn
+in zombie_squirrel.acorns.ACORN_REGISTRY.
 """
 
 __version__ = "0.19.0"
@@ -22,3 +25,17 @@ from zombie_squirrel.acorn_helpers.unique_subject_ids import (  # noqa: F401
     unique_subject_ids,
 )
 from zombie_squirrel.utils import get_squirrel_info  # noqa: F401
+
+__all__ = [
+    "asset_basics",
+    "assets_smartspim",
+    "custom",
+    "metadata_upgrade",
+    "qc",
+    "qc_columns",
+    "raw_to_derived",
+    "source_data",
+    "unique_project_names",
+    "unique_subject_ids",
+    "get_squirrel_info",
+]
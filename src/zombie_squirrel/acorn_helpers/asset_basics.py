@@ -1,9 +1,9 @@
 """Asset basics acorn."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.squirrel import Column
@@ -12,6 +12,67 @@ from zombie_squirrel.utils import (
     setup_logging,
 )
 
+FIELDS = [
+    "data_description.modalities",
+    "data_description.project_name",
+    "data_description.data_level",
+    "subject.subject_id",
+    "acquisition.acquisition_start_time",
+    "acquisition.acquisition_end_time",
+    "acquisition.acquisition_type",
+    "acquisition.subject_details.date_of_birth",
+    "acquisition.subject_details.year_of_birth",
+    "processing.data_processes.start_date_time",
+    "subject.subject_details.genotype",
+    "other_identifiers",
+    "location",
+    "name",
+    "acquisition.experimenters",
+    "acquisition.instrument_id",
+]
+_PROJECTION = {field: 1 for field in FIELDS + ["_id", "_last_modified"]}
+
+
+def _flat_column(flat: pd.DataFrame, name: str) -> list:
+    """Return a json_normalize'd column as a list, with missing values as None."""
+    if name not in flat.columns:
+        return [None] * len(flat)
+    column = flat[name].astype(object)
+    return column.where(column.notna(), None).tolist()
+
+
+def _join_modalities(modalities: list[dict] | None) -> str:
+    """Join modality abbreviations into a comma-separated string."""
+    return ", ".join(modality["abbreviation"] for modality in (modalities or []) if "abbreviation" in modality)
+
+
+def _latest_process_date(data_processes: list[dict] | None) -> str | None:
+    """Return the latest processing start date in YYYY-MM-DD format, if any."""
+    if not data_processes:
+        return None
+    process_datetime = data_processes[-1].get("start_date_time", None)
+    return process_datetime.split("T")[0] if process_datetime else None
+
+
+def _join_experimenters(experimenters: list | None) -> str:
+    """Join experimenter names (plain strings or person dicts) into a comma-separated string."""
+    return ", ".join(e if isinstance(e, str) else e.get("name", "") for e in (experimenters or []))
+
+
+def _age_in_days(acquisition_start: str | None, date_of_birth: str | None, year_of_birth: int | None) -> int | None:
+    """Calculate age in days from acquisition_start_time and date_of_birth or year_of_birth."""
+    if not acquisition_start or not (date_of_birth or year_of_birth):
+        return None
+    try:
+        acq_date = pd.to_datetime(acquisition_start)
+        if date_of_birth:
+            dob = pd.to_datetime(date_of_birth)
+        else:
+            dob = pd.Timestamp(int(year_of_birth), 1, 1)
+        return (acq_date - dob).days
+    except Exception:
+        return None
+
 
 @acorns.register_acorn(acorns.NAMES["basics"])
 def asset_basics(force_update: bool = False) -> pd.DataFrame:
@@ -29,26 +90,8 @@ def asset_basics(force_update: bool = False) -> pd.DataFrame:
         DataFrame with basic asset metadata.
 
     """
-    df = acorns.TREE.scurry(acorns.NAMES["basics"])
-
-    FIELDS = [
-        "data_description.modalities",
-        "data_description.project_name",
-        "data_description.data_level",
-        "subject.subject_id",
-        "acquisition.acquisition_start_time",
-        "acquisition.acquisition_end_time",
-        "acquisition.acquisition_type",
-        "acquisition.subject_details.date_of_birth",
-        "acquisition.subject_details.year_of_birth",
-        "processing.data_processes.start_date_time",
-        "subject.subject_details.genotype",
-        "other_identifiers",
-        "location",
-        "name",
-        "acquisition.experimenters",
-        "acquisition.instrument_id",
-    ]
+    # A forced refresh rebuilds the table from DocDB, so don't read the cache first
+    df = pd.DataFrame() if force_update else acorns.TREE.scurry(acorns.NAMES["basics"])
 
     if df.empty and not force_update:
         raise ValueError("Cache is empty. Use force_update=True to fetch data from database.")
@@ -81,10 +124,7 @@ def asset_basics(force_update: bool = False) -> pd.DataFrame:
                 "instrument_id",
             ]
         )
-        client = MetadataDbClient(
-            host=acorns.API_GATEWAY_HOST,
-            version="v2",
-        )
+        client = acorns.get_metadata_client()
         # It's a bit complex to get multiple fields that aren't indexed in a database
         # as large as DocDB. We'll also try to limit ourselves to only updating fields
         # that are necessary
@@ -93,99 +133,81 @@ def asset_basics(force_update: bool = False) -> pd.DataFrame:
             projection={"_id": 1, "_last_modified": 1},
             limit=0,
         )
-        keep_ids = []
         # Drop all _ids where _last_modified matches cache
-        for record in record_ids:
-            cached_row = df[df["_id"] == record["_id"]]
-            if cached_row.empty or cached_row["_last_modified"].values[0] != record["_last_modified"]:
-                keep_ids.append(record["_id"])
+        record_mod = pd.DataFrame(record_ids, columns=["_id", "_last_modified"])
+        merged = record_mod.merge(
+            df[["_id", "_last_modified"]].rename(columns={"_last_modified": "cached_mod"}), on="_id", how="left"
+        )
+        keep_ids = merged.loc[merged["cached_mod"] != merged["_last_modified"], "_id"].tolist()
 
-        # Now batch by 100 IDs at a time to avoid overloading server, and fetch all the fields
+        # Now batch by 100 IDs at a time to avoid overloading server, and fetch all the fields.
+        # Batches are independent network round-trips, so dispatch them concurrently.
         BATCH_SIZE = 100
-        asset_records = []
-        for i in range(0, len(keep_ids), BATCH_SIZE):
-            logging.info(
-                SquirrelMessage(
-                    tree=acorns.TREE.__class__.__name__,
-                    acorn=acorns.NAMES["basics"],
-                    message=f"Fetching batch {i // BATCH_SIZE + 1}",
-                ).to_json()
-            )
+        MAX_WORKERS = 8
+
+        def fetch_batch(i: int) -> pd.DataFrame:
+            """Fetch one batch of records starting at offset i of keep_ids and flatten it."""
             batch_ids = keep_ids[i : i + BATCH_SIZE]
             batch_records = client.retrieve_docdb_records(
                 filter_query={"_id": {"$in": batch_ids}},
-                projection={field: 1 for field in FIELDS + ["_id", "_last_modified"]},
+                projection=_PROJECTION,
                 limit=0,
             )
-            asset_records.extend(batch_records)
-
-        # Unwrap nested fields
-        records = []
-        for record in asset_records:
-            modalities = record.get("data_description", {}).get("modalities", [])
-            modality_abbreviations = [modality["abbreviation"] for modality in modalities if "abbreviation" in modality]
-            modality_abbreviations_str = ", ".join(modality_abbreviations)
-
-            # Get the process date, convert to YYYY-MM-DD if present
-            data_processes = record.get("processing", {}).get("data_processes", [])
-            if data_processes:
-                latest_process = data_processes[-1]
-                process_datetime = latest_process.get("start_date_time", None)
-                process_date = process_datetime.split("T")[0]
-            else:
-                process_date = None
-
-            # Get the CO asset ID
-            other_identifiers = record.get("other_identifiers", {})
-            if other_identifiers:
-                code_ocean = other_identifiers.get("Code Ocean", None)
-            else:
-                code_ocean = None
-
-            # Calculate age in days from acquisition_start_time and date_of_birth or year_of_birth
-            acquisition_start = record.get("acquisition", {}).get("acquisition_start_time", None)
-            acq_subject_details = record.get("acquisition", {}).get("subject_details", {}) or {}
-            date_of_birth = acq_subject_details.get("date_of_birth", None)
-            year_of_birth = acq_subject_details.get("year_of_birth", None)
-            age = None
-            if acquisition_start and (date_of_birth or year_of_birth):
-                try:
-                    acq_date = pd.to_datetime(acquisition_start)
-                    if date_of_birth:
-                        dob = pd.to_datetime(date_of_birth)
-                    else:
-                        dob = pd.Timestamp(int(year_of_birth), 1, 1)
-                    age = (acq_date - dob).days
-                except Exception:
-                    age = None
-
-            flat_record = {
-                "_id": record["_id"],
-                "_last_modified": record.get("_last_modified", None),
-                "modalities": modality_abbreviations_str,
-                "project_name": record.get("data_description", {}).get("project_name", None),
-                "data_level": record.get("data_description", {}).get("data_level", None),
-                "subject_id": record.get("subject", {}).get("subject_id", None),
-                "acquisition_start_time": record.get("acquisition", {}).get("acquisition_start_time", None),
-                "acquisition_end_time": record.get("acquisition", {}).get("acquisition_end_time", None),
-                "code_ocean": code_ocean,
-                "process_date": process_date,
-                "genotype": record.get("subject", {}).get("subject_details", {}).get("genotype", None),
-                "age": age,
-                "acquisition_type": record.get("acquisition", {}).get("acquisition_type", None),
-                "location": record.get("location", None),
-                "name": record.get("name", None),
-                "experimenters": ", ".join(
-                    e if isinstance(e, str) else e.get("name", "")
-                    for e in (record.get("acquisition", {}).get("experimenters", []) or [])
-                ),
-                "instrument_id": record.get("acquisition", {}).get("instrument_id", None),
+            # Flatten inside the worker so the raw record dicts can be freed per batch
+            return pd.json_normalize(batch_records, sep=".")
+
+        logging.info(
+            SquirrelMessage(
+                tree=acorns.TREE.__class__.__name__,
+                acorn=acorns.NAMES["basics"],
+                message=f"Fetching {len(keep_ids)} records in {(len(keep_ids) + BATCH_SIZE - 1) // BATCH_SIZE} batches",
+            ).to_json()
+        )
+        offsets = range(0, len(keep_ids), BATCH_SIZE)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            frames = list(executor.map(fetch_batch, offsets))
+
+        # Unwrap nested fields column-wise
+        flat = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        acquisition_start = _flat_column(flat, "acquisition.acquisition_start_time")
+        new_df = pd.DataFrame(
+            {
+                "_id": _flat_column(flat, "_id"),
+                "_last_modified": _flat_column(flat, "_last_modified"),
+                "modalities": [_join_modalities(value) for value in _flat_column(flat, "data_description.modalities")],
+                "project_name": _flat_column(flat, "data_description.project_name"),
+                "data_level": _flat_column(flat, "data_description.data_level"),
+                "subject_id": _flat_column(flat, "subject.subject_id"),
+                "acquisition_start_time": acquisition_start,
+                "acquisition_end_time": _flat_column(flat, "acquisition.acquisition_end_time"),
+                "code_ocean": _flat_column(flat, "other_identifiers.Code Ocean"),
+                "process_date": [
+                    _latest_process_date(value) for value in _flat_column(flat, "processing.data_processes")
+                ],
+                "genotype": _flat_column(flat, "subject.subject_details.genotype"),
+                "age": [
+                    _age_in_days(start, dob, yob)
+                    for start, dob, yob in zip(
+                        acquisition_start,
+                        _flat_column(flat, "acquisition.subject_details.date_of_birth"),
+                        _flat_column(flat, "acquisition.subject_details.year_of_birth"),
+                        strict=False,
+                    )
+                ],
+                "acquisition_type": _flat_column(flat, "acquisition.acquisition_type"),
+                "location": _flat_column(flat, "location"),
+                "name": _flat_column(flat, "name"),
+                "experimenters": [
+                    _join_experimenters(value) for value in _flat_column(flat, "acquisition.experimenters")
+                ],
+                "instrument_id": _flat_column(flat, "acquisition.instrument_id"),
             }
-            records.append(flat_record)
+        )
 
-        # Combine new records with the old df and store in cache
-        new_df = pd.DataFrame(records)
+        # Combine new records with the old df and store in cache, ordered by _last_modified so
+        # each parquet row group covers a narrow modification window
         df = pd.concat([df[~df["_id"].isin(keep_ids)], new_df], ignore_index=True)
+        df = df.sort_values("_last_modified", ignore_index=True, kind="stable")
 
         acorns.TREE.hide(acorns.NAMES["basics"], df)
 
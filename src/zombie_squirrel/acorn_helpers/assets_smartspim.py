@@ -1,20 +1,32 @@
 """SmartSPIM assets acorn."""
 
 import logging
+from functools import cache
 
 import boto3
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.acorn_helpers.asset_basics import asset_basics
 from zombie_squirrel.acorn_helpers.source_data import source_data
+from zombie_squirrel.forest import S3_CLIENT_CONFIG
 from zombie_squirrel.squirrel import Column
 from zombie_squirrel.utils import SquirrelMessage, setup_logging
 
 NEUROGLANCER_BASE = "https://allen.neuroglass.io/new#!"
 AIND_OPEN_DATA_BUCKET = "aind-open-data"
 
+_METADATA_FIELDS = [
+    "name",
+    "subject.subject_id",
+    "subject.subject_details.genotype",
+    "data_description.institution",
+    "acquisition.acquisition_start_time",
+    "processing.data_processes",
+    "location",
+]
+_METADATA_PROJECTION = {field: 1 for field in _METADATA_FIELDS + ["_id"]}
+
 
 def _stitched_link(location: str) -> str:
     return f"{NEUROGLANCER_BASE}{location}/neuroglancer_config.json"
@@ -28,9 +40,15 @@ def _quantification_link(location: str, channel: str) -> str:
     return f"{NEUROGLANCER_BASE}{location}/image_cell_quantification/{channel}/visualization/neuroglancer_config.json"
 
 
+@cache
+def _s3_client():
+    """Return the S3 client used to list channels, shared across every stitched asset."""
+    return boto3.client("s3", config=S3_CLIENT_CONFIG)
+
+
 def _list_channels(location: str) -> list[str]:
     """List channel subfolders under image_cell_segmentation/ for a given asset location."""
-    s3_client = boto3.client("s3")
+    s3_client = _s3_client()
     prefix = location.replace(f"s3://{AIND_OPEN_DATA_BUCKET}/", "") + "/image_cell_segmentation/"
     result = s3_client.list_objects_v2(
         Bucket=AIND_OPEN_DATA_BUCKET,
@@ -42,27 +60,14 @@ def _list_channels(location: str) -> list[str]:
 
 def _fetch_asset_metadata(asset_names: list[str]) -> dict[str, dict]:
     """Fetch metadata for assets (raw or stitched) from the document DB in batches of 100."""
-    client = MetadataDbClient(
-        host=acorns.API_GATEWAY_HOST,
-        version="v2",
-    )
-    fields = [
-        "name",
-        "subject.subject_id",
-        "subject.subject_details.genotype",
-        "data_description.institution",
-        "acquisition.acquisition_start_time",
-        "processing.data_processes",
-        "location",
-    ]
-    projection = {field: 1 for field in fields + ["_id"]}
+    client = acorns.get_metadata_client()
     BATCH_SIZE = 100
     all_records = []
     for i in range(0, len(asset_names), BATCH_SIZE):
         batch = asset_names[i : i + BATCH_SIZE]
         batch_records = client.retrieve_docdb_records(
             filter_query={"name": {"$in": batch}},
-            projection=projection,
+            projection=_METADATA_PROJECTION,
             limit=0,
         )
         all_records.extend(batch_records)
@@ -141,7 +146,7 @@ def assets_smartspim(force_update: bool = False) -> pd.DataFrame:
         processing_end_time, stitched_link, channel, segmentation_link,
         quantification_link, name.
     """
-    df = acorns.TREE.scurry(acorns.NAMES["smartspim"])
+    df = pd.DataFrame() if force_update else acorns.TREE.scurry(acorns.NAMES["smartspim"])
 
     if df.empty and not force_update:
         raise ValueError("Cache is empty. Use force_update=True to fetch data from database.")
@@ -172,7 +177,10 @@ def assets_smartspim(force_update: bool = False) -> pd.DataFrame:
             .first()
         )
         raw_to_stitched_series = stitched_candidates.set_index("source_data")["name"]
-        raw_to_stitched = {name: raw_to_stitched_series.get(name) for name in raw_spim_names}
+        stitched_for_raw = raw_to_stitched_series.reindex(raw_spim_names).astype(object)
+        raw_to_stitched = dict(
+            zip(raw_spim_names, stitched_for_raw.where(stitched_for_raw.notna(), None).tolist(), strict=False)
+        )
 
         stitched_names = [v for v in raw_to_stitched.values() if v is not None]
         raw_without_stitched = [k for k, v in raw_to_stitched.items() if v is None]
@@ -2,7 +2,6 @@
 
 import logging
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.acorn_helpers.custom import custom
@@ -79,10 +78,7 @@ def metadata_upgrade(force_update: bool = False) -> pd.DataFrame:
         successful = successful.merge(v2_lookup, on="v2_id", how="left")
 
         if not failed.empty:
-            v1_client = MetadataDbClient(
-                host=acorns.API_GATEWAY_HOST,
-                version="v1",
-            )
+            v1_client = acorns.get_metadata_client("v1")
             v1_ids = failed["_id"].tolist()
             v1_records = []
             BATCH_SIZE = 100
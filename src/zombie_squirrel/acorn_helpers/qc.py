@@ -4,7 +4,6 @@ import logging
 from datetime import datetime
 
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.squirrel import Column
@@ -18,7 +17,6 @@ QC_METRIC_FIELDS = [
     "modality",
     "stage",
     "value",
-    "status_history",
 ]
 
 
@@ -31,11 +29,10 @@ def qc(
 ) -> pd.DataFrame | str:
     """Fetch quality control metrics for assets belonging to a subject.
 
-    Returns a DataFrame with columns from the quality_control metrics
-    including: name, stage, object_type, modality, value, status,
-    status_history, asset_name, subject_id, and timestamp. Special handling:
+    Returns a DataFrame with columns from the quality_control metrics:
+    name, stage, modality, value, asset_name, subject_id, and timestamp.
+    Special handling:
     - modality: extracts the "abbreviation" field from the dict
-    - status_history: takes the last element and extracts the "status" field
     - value: if the stored value is a dict value["value"] is extracted
     Timestamp is the unix timestamp (seconds since epoch) from
     acquisition.acquisition_start_time.
@@ -68,15 +65,12 @@ def qc(
             _fetch_subject_qc(subject_id)
         return acorns.TREE.get_location(cache_key)
 
-    df = acorns.TREE.scurry(cache_key)
+    df = pd.DataFrame() if force_update else acorns.TREE.scurry(cache_key)
 
     if df.empty and not force_update:
-        logging.error(
-            SquirrelMessage(
-                tree=acorns.TREE.__class__.__name__,
-                acorn=acorns.NAMES["qc"],
-                message=f"Cache is empty for subject {subject_id}. Use force_update=True to fetch data from database.",
-            ).to_json()
+        _log(
+            logging.ERROR,
+            f"Cache is empty for subject {subject_id}. Use force_update=True to fetch data from database.",
         )
 
     if force_update:
@@ -88,30 +82,58 @@ def qc(
     return df
 
 
+def _log(level: int, message: str) -> None:
+    """Log a QC SquirrelMessage, skipping the JSON encode when the level is disabled."""
+    if logging.getLogger().isEnabledFor(level):
+        logging.log(
+            level,
+            SquirrelMessage(tree=acorns.TREE.__class__.__name__, acorn=acorns.NAMES["qc"], message=message).to_json(),
+        )
+
+
+def _modality_abbreviation(modality):
+    """Return the abbreviation of a modality dict, passing other values through."""
+    return modality.get("abbreviation", None) if isinstance(modality, dict) else modality
+
+
+# DocDB values decode to plain builtins, so dispatching on the exact type avoids an isinstance chain
+_VALUE_ENCODERS = {
+    str: lambda value: value,
+    type(None): lambda value: value,
+    dict: lambda value: "{dict}",
+}
+
+
+def _value_to_str(value) -> str | None:
+    """Replace dict values with "{dict}" and stringify other non-string values."""
+    encoder = _VALUE_ENCODERS.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    # Subclasses (OrderedDict, str-based enums) keep the behaviour of their base type
+    if isinstance(value, dict):
+        return "{dict}"
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
 def _fetch_subject_qc(subject_id: str) -> pd.DataFrame:
     """Fetch QC data for a subject from the database and cache it."""
     setup_logging()
     cache_key = f"qc/{subject_id}"
 
-    logging.info(
-        SquirrelMessage(
-            tree=acorns.TREE.__class__.__name__,
-            acorn=acorns.NAMES["qc"],
-            message=f"Updating cache for subject {subject_id}",
-        ).to_json()
-    )
+    _log(logging.INFO, f"Updating cache for subject {subject_id}")
 
-    client = MetadataDbClient(
-        host=acorns.API_GATEWAY_HOST,
-        version="v2",
-    )
+    client = acorns.get_metadata_client()
 
     records = client.retrieve_docdb_records(
         filter_query={"subject.subject_id": subject_id},
+        # Only pull the metric fields that end up in the table, not whole QC blobs
         projection={
             "_id": 1,
             "name": 1,
-            "quality_control": 1,
+            "quality_control.metrics.object_type": 1,
+            **{f"quality_control.metrics.{col}": 1 for col in QC_METRIC_FIELDS},
             "acquisition.acquisition_start_time": 1,
             "subject.subject_id": 1,
         },
@@ -119,16 +141,11 @@ def _fetch_subject_qc(subject_id: str) -> pd.DataFrame:
     )
 
     if not records:
-        logging.warning(
-            SquirrelMessage(
-                tree=acorns.TREE.__class__.__name__,
-                acorn=acorns.NAMES["qc"],
-                message=f"No records found for subject {subject_id}",
-            ).to_json()
-        )
+        _log(logging.WARNING, f"No records found for subject {subject_id}")
         return pd.DataFrame()
 
-    all_metrics = []
+    # Collect one list per output column rather than one dict per metric
+    columns = {col: [] for col in QC_METRIC_FIELDS + ["asset_name", "subject_id", "timestamp"]}
     for record in records:
         asset_name = record.get("name", "")
         quality_control = record.get("quality_control", {})
@@ -152,54 +169,27 @@ def _fetch_subject_qc(subject_id: str) -> pd.DataFrame:
             if metric.get("object_type", "") == "Curation metric":
                 continue
 
-            metric_data = {}
             for col in QC_METRIC_FIELDS:
-                value = metric.get(col, None)
-
-                if col == "modality" and isinstance(value, dict):
-                    value = value.get("abbreviation", None)
-                elif col == "status_history" and isinstance(value, list) and len(value) > 0:
-                    value = value[-1].get("status", None) if isinstance(value[-1], dict) else None
-                elif col == "value":
-                    if isinstance(value, dict):
-                        value = "{dict}"
-                    elif value is not None and not isinstance(value, str):
-                        value = str(value)
-
-                metric_data[col] = value
-            metric_data["asset_name"] = asset_name
-            metric_data["subject_id"] = subject_id_value
-            metric_data["timestamp"] = timestamp
-            all_metrics.append(metric_data)
-
-    if not all_metrics:
-        logging.warning(
-            SquirrelMessage(
-                tree=acorns.TREE.__class__.__name__,
-                acorn=acorns.NAMES["qc"],
-                message=f"No quality_control metrics found for subject {subject_id}",
-            ).to_json()
-        )
+                columns[col].append(metric.get(col, None))
+            columns["asset_name"].append(asset_name)
+            columns["subject_id"].append(subject_id_value)
+            columns["timestamp"].append(timestamp)
+
+    n_metrics = len(columns["asset_name"])
+    if not n_metrics:
+        _log(logging.WARNING, f"No quality_control metrics found for subject {subject_id}")
         return pd.DataFrame()
 
-    df = pd.DataFrame.from_records(all_metrics)
+    df = pd.DataFrame(columns)
 
-    # Drop the object_type and status_history columns, if they exist
-    if "object_type" in df.columns:
-        df = df.drop(columns=["object_type"])
-    if "status_history" in df.columns:
-        df = df.drop(columns=["status_history"])
+    # Normalize nested fields one column at a time instead of per metric
+    df["modality"] = [_modality_abbreviation(value) for value in df["modality"]]
+    df["value"] = [_value_to_str(value) for value in df["value"]]
 
     df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
     acorns.TREE.hide(cache_key, df)
 
-    logging.info(
-        SquirrelMessage(
-            tree=acorns.TREE.__class__.__name__,
-            acorn=acorns.NAMES["qc"],
-            message=f"Cached QC data for subject {subject_id} ({len(records)} assets, {len(all_metrics)} metrics)",
-        ).to_json()
-    )
+    _log(logging.INFO, f"Cached QC data for subject {subject_id} ({len(records)} assets, {n_metrics} metrics)")
 
     return df
 
@@ -211,8 +201,9 @@ def qc_columns() -> list[Column]:
         Column(name="stage", description="Stage: raw, processing, or analysis"),
         Column(name="modality", description="Modality abbreviation"),
         Column(name="value", description="Metric value, converted to string if not already a string"),
-        Column(name="status", description="Latest metric status (fail, pass, pending)"),
         Column(name="asset_name", description="Asset name the metric is associated with"),
+        Column(name="subject_id", description="Subject ID the asset belongs to"),
+        Column(name="timestamp", description="Acquisition start time of the asset (UTC)"),
     ]
 
 
@@ -224,17 +215,18 @@ def _filter_by_asset_names(df: pd.DataFrame, asset_names: str | list[str], subje
     if isinstance(asset_names, str):
         asset_names = [asset_names]
 
+    # isin on a frozenset works the same for object, string and categorical columns
+    wanted = frozenset(asset_names)
+    mask = df["asset_name"].isin(wanted)
     available_assets = df["asset_name"].unique().tolist()
-    missing_assets = [name for name in asset_names if name not in available_assets]
+    available_set = frozenset(available_assets)
+    missing_assets = [name for name in asset_names if name not in available_set]
 
     if missing_assets:
-        logging.warning(
-            SquirrelMessage(
-                tree=acorns.TREE.__class__.__name__,
-                acorn=acorns.NAMES["qc"],
-                message=f"Requested asset(s) {missing_assets} not found in cache for subject {subject_id}. "
-                f"Available assets: {available_assets}",
-            ).to_json()
+        _log(
+            logging.WARNING,
+            f"Requested asset(s) {missing_assets} not found in cache for subject {subject_id}. "
+            f"Available assets: {available_assets}",
         )
 
-    return df[df["asset_name"].isin(asset_names)].reset_index(drop=True)
+    return df[mask].reset_index(drop=True)
@@ -21,7 +21,7 @@ def raw_to_derived(
 
     """
     df = source_data(force_update=force_update)
-    matches = df[df["source_data"] == asset_name].copy()
+    matches = df[df["source_data"] == asset_name]
     if modality is not None:
         basics = asset_basics()
         modality_names = basics[basics["modalities"].str.contains(modality, na=False)]["name"]
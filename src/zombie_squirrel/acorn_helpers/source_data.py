@@ -4,7 +4,6 @@ import logging
 import re
 
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.squirrel import Column
@@ -16,12 +15,6 @@ from zombie_squirrel.utils import (
 _DATETIME_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})$")
 
 
-def _extract_processing_time(name: str) -> str:
-    """Extract processing time from asset name using regex pattern."""
-    match = _DATETIME_PATTERN.search(name)
-    return match.group(1) if match else ""
-
-
 @acorns.register_acorn(acorns.NAMES["d2r"])
 def source_data(force_update: bool = False) -> pd.DataFrame:
     """Fetch derived asset table with one row per derived asset per source.
@@ -36,7 +29,7 @@ def source_data(force_update: bool = False) -> pd.DataFrame:
         DataFrame with name, source_data, pipeline_name, and processing_time columns.
 
     """
-    df = acorns.TREE.scurry(acorns.NAMES["d2r"])
+    df = pd.DataFrame() if force_update else acorns.TREE.scurry(acorns.NAMES["d2r"])
 
     if df.empty and not force_update:
         raise ValueError("Cache is empty. Use force_update=True to fetch data from database.")
@@ -48,43 +41,36 @@ def source_data(force_update: bool = False) -> pd.DataFrame:
                 tree=acorns.TREE.__class__.__name__, acorn=acorns.NAMES["d2r"], message="Updating cache"
             ).to_json()
         )
-        client = MetadataDbClient(
-            host=acorns.API_GATEWAY_HOST,
-            version="v2",
-        )
+        client = acorns.get_metadata_client()
         records = client.retrieve_docdb_records(
             filter_query={"data_description.data_level": "derived"},
-            projection={"name": 1, "data_description.source_data": 1, "processing.pipelines": 1},
+            # Only the pipeline name is used, so don't pull whole pipeline objects over the wire
+            projection={"name": 1, "data_description.source_data": 1, "processing.pipelines.name": 1},
             limit=0,
         )
-        data = []
-        for record in records:
-            name = record["name"]
-            source_data_list = record.get("data_description", {}).get("source_data", []) or []
-            pipelines = record.get("processing", {}).get("pipelines", []) or []
-            pipeline_name = pipelines[0].get("name", "") if pipelines else ""
-            processing_time = _extract_processing_time(name)
-            if source_data_list:
-                for source_name in source_data_list:
-                    data.append(
-                        {
-                            "name": name,
-                            "source_data": source_name,
-                            "pipeline_name": pipeline_name,
-                            "processing_time": processing_time,
-                        }
-                    )
-            else:
-                data.append(
-                    {
-                        "name": name,
-                        "source_data": "",
-                        "pipeline_name": pipeline_name,
-                        "processing_time": processing_time,
-                    }
-                )
-
-        df = pd.DataFrame(data)
+        # Flatten once, then explode to one row per source data entry
+        flat = pd.json_normalize(records, sep=".").reindex(
+            columns=["name", "data_description.source_data", "processing.pipelines"]
+        )
+        # The flattened frame holds everything needed; release the raw record dicts
+        del records
+        df = pd.DataFrame(
+            {
+                "name": flat["name"].tolist(),
+                "source_data": [
+                    sources if isinstance(sources, list) and sources else [""]
+                    for sources in flat["data_description.source_data"]
+                ],
+                "pipeline_name": [
+                    pipelines[0].get("name", "") if isinstance(pipelines, list) and pipelines else ""
+                    for pipelines in flat["processing.pipelines"]
+                ],
+            }
+        )
+        df["processing_time"] = df["name"].astype(str).str.extract(_DATETIME_PATTERN, expand=False).fillna("")
+        # Every column is a string; store them as Arrow strings rather than Python objects.
+        # Fill missing entries first so lookups compare against "" rather than pd.NA
+        df = df.explode("source_data", ignore_index=True).fillna("").astype("string[pyarrow]")
         acorns.TREE.hide(acorns.NAMES["d2r"], df)
 
     return df
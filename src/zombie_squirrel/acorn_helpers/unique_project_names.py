@@ -3,7 +3,6 @@
 import logging
 
 import pandas as pd
-from aind_data_access_api.document_db import MetadataDbClient
 
 import zombie_squirrel.acorns as acorns
 from zombie_squirrel.squirrel import Column
@@ -27,7 +26,7 @@ def unique_project_names(force_update: bool = False) -> list[str]:
         List of unique project names.
 
     """
-    df = acorns.TREE.scurry(acorns.NAMES["upn"])
+    df = pd.DataFrame() if force_update else acorns.TREE.scurry(acorns.NAMES["upn"], columns=["project_name"])
 
     if df.empty and not force_update:
         raise ValueError("Cache is empty. Use force_update=True to fetch data from database.")
@@ -39,10 +38,7 @@ def unique_project_names(force_update: bool = False) -> list[str]:
                 tree=acorns.TREE.__class__.__name__, acorn=acorns.NAMES["upn"], message="Updating cache"
             ).to_json()
         )
-        client = MetadataDbClient(
-            host=acorns.API_GATEWAY_HOST,
-            version="v2",
-        )
+        client = acorns.get_metadata_client()
         unique_project_names = client.aggregate_docdb_records(
             pipeline=[
                 {"$group": {"_id": "$data_description.project_name"}},
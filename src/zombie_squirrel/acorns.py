@@ -3,7 +3,8 @@
 import logging
 import os
 from collections.abc import Callable
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from zombie_squirrel.forest import (
     MemoryTree,
@@ -11,10 +12,30 @@ from zombie_squirrel.forest import (
 )
 from zombie_squirrel.utils import SquirrelMessage
 
+if TYPE_CHECKING:  # pragma: no cover
+    from aind_data_access_api.document_db import MetadataDbClient
+
 # --- Backend setup ---------------------------------------------------
 
 API_GATEWAY_HOST = "api.allenneuraldynamics.org"
 
+
+@cache
+def get_metadata_client(version: str = "v2") -> "MetadataDbClient":
+    """Return a shared MetadataDbClient for the given API version.
+
+    The client is created once per version so every acorn reuses the same
+    HTTP session (and its pooled connections) instead of reconnecting. The
+    client library is imported here so cache-only readers never load it.
+    """
+    from aind_data_access_api.document_db import MetadataDbClient
+
+    return MetadataDbClient(
+        host=API_GATEWAY_HOST,
+        version=version,
+    )
+
+
 forest_type = os.getenv("FOREST_TYPE", "memory").lower()
 
 if forest_type == "s3":  # pragma: no cover
@@ -3,14 +3,64 @@
 import io
 import json
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cache
 
 import boto3
 import duckdb
 import pandas as pd
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 
 from zombie_squirrel.utils import SquirrelMessage, get_s3_cache_path, prefix_table_name
 
+# Number of tables S3Tree keeps deserialized in memory between scurry calls
+MEMO_SIZE = 32
+
+# Room for concurrent QC uploads plus their multipart parts, backing off adaptively when S3 throttles
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Rows per parquet row group; smaller groups give readers finer-grained min/max statistics to skip on
+ROW_GROUP_SIZE = 50_000
+
+# Large parquet files are uploaded as parallel 16 MiB multipart chunks
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True,
+)
+
+
+@cache
+def _duckdb_connection() -> duckdb.DuckDBPyConnection:
+    """Return the DuckDB connection shared by every S3Tree read in this process."""
+    return duckdb.connect(config={"threads": os.cpu_count() or 1})
+
+
+def _duckdb_query(query: str, params: dict | None = None) -> duckdb.DuckDBPyRelation:
+    """Run a query on its own cursor of the shared connection.
+
+    Cursors share the connection's database, loaded extensions and S3
+    state, but can be used safely from separate threads. Values such as
+    parquet paths are passed as named params so the SQL text stays fixed.
+    """
+    return _duckdb_connection().cursor().query(query, params=params)
+
+
+def _column_list(columns: list[str] | None, all_columns: str = "*") -> str:
+    """Return a SELECT list of quoted column identifiers, or all_columns when none are given."""
+    if not columns:
+        return all_columns
+    return ", ".join('"' + col.replace('"', '""') + '"' for col in columns)
+
 
 class Tree(ABC):
     """Base class for a storage backend (the cache)."""
@@ -25,13 +75,15 @@ class Tree(ABC):
         pass  # pragma: no cover
 
     @abstractmethod
-    def scurry(self, table_name: str | list[str]) -> pd.DataFrame:
+    def scurry(self, table_name: str | list[str], columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch records from the cache.
 
         Args:
             table_name: Single table name or list of table names.
                 When a list is provided, merges all tables and adds
                 an 'asset_name' column to differentiate sources.
+            columns: Optional list of columns to read. When None, all
+                columns are returned.
 
         """
         pass  # pragma: no cover
@@ -56,9 +108,28 @@ class S3Tree(Tree):
     """Stores and retrieves caches using AWS S3 with parquet files."""
 
     def __init__(self) -> None:
-        """Initialize S3Acorn with S3 client."""
+        """Initialize S3Acorn; the S3 client is created on first use."""
         self.bucket = "allen-data-views"
-        self.s3_client = boto3.client("s3")
+        # (table_name, columns) -> (ETag, DataFrame) for tables already read by this process
+        self._memo: OrderedDict[tuple, tuple[str, pd.DataFrame]] = OrderedDict()
+        self._memo_lock = threading.Lock()
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+
+    @property
+    def s3_client(self):
+        """Return the boto3 S3 client, creating it on first access.
+
+        Reads use it too, for the ETag check in scurry, so only a tree that is
+        constructed and never used avoids building a client. The client is
+        built under a lock because hide_acorns reaches a fresh tree from
+        several threads at once, and boto3 client creation is not thread-safe.
+        """
+        if self._s3_client is None:
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.client("s3", config=S3_CLIENT_CONFIG)
+        return self._s3_client
 
     def hide(self, table_name: str, data: pd.DataFrame) -> None:
         """Store DataFrame as parquet file in S3."""
@@ -67,20 +138,16 @@ class S3Tree(Tree):
 
         # Convert DataFrame to parquet bytes
         parquet_buffer = io.BytesIO()
-        data.to_parquet(parquet_buffer, index=False)
-        parquet_buffer.seek(0)
-
-        # Upload to S3
-        self.s3_client.put_object(
-            Bucket=self.bucket,
-            Key=s3_key,
-            Body=parquet_buffer.getvalue(),
-        )
-        logging.info(
-            SquirrelMessage(
-                tree="S3Tree", acorn=table_name, message=f"Stored cache to s3://{self.bucket}/{s3_key}"
-            ).to_json()
+        data.to_parquet(
+            parquet_buffer,
+            index=False,
+            engine="pyarrow",
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            row_group_size=ROW_GROUP_SIZE,
         )
+        parquet_buffer.seek(0)
 
         metadata = {"columns": data.columns.tolist()}
         if table_name.startswith("qc/"):
@@ -88,40 +155,60 @@ class S3Tree(Tree):
         else:
             json_filename = filename.replace(".pqt", ".json")
             json_key = get_s3_cache_path(json_filename)
+
+        # Upload to S3, streaming from the buffer rather than copying it with getvalue()
+        self.s3_client.upload_fileobj(parquet_buffer, self.bucket, s3_key, Config=TRANSFER_CONFIG)
         self.s3_client.put_object(
             Bucket=self.bucket,
             Key=json_key,
-            Body=json.dumps(metadata),
+            Body=json.dumps(metadata, separators=(",", ":")),
+        )
+        self._forget(table_name)
+        logging.info(
+            SquirrelMessage(
+                tree="S3Tree", acorn=table_name, message=f"Stored cache to s3://{self.bucket}/{s3_key}"
+            ).to_json()
         )
 
-    def scurry(self, table_name: str | list[str]) -> pd.DataFrame:
+    def scurry(self, table_name: str | list[str], columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch DataFrame from S3 parquet file(s).
 
         When given a list of table names, merges them using DuckDB
-        and adds an 'asset_name' column.
+        and adds an 'asset_name' column. When columns is given, only
+        those columns are read from the parquet file(s).
         """
         if isinstance(table_name, list):
-            return self._scurry_multiple(table_name)
-        return self._scurry_single(table_name)
+            return self._scurry_multiple(table_name, columns)
+        return self._scurry_single(table_name, columns)
 
-    def _scurry_single(self, table_name: str) -> pd.DataFrame:
+    def _scurry_single(self, table_name: str, columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch a single table from S3."""
         filename = prefix_table_name(table_name)
         s3_key = get_s3_cache_path(filename)
+        col_expr = _column_list(columns)
+        memo_key = (table_name, tuple(columns) if columns else None)
+
+        # A HEAD request is much cheaper than re-reading the parquet file, and the
+        # ETag tells us whether the copy we already deserialized is still current.
+        # The check is only an optimisation: if it fails, read the file without the memo
+        etag = self._etag(table_name, s3_key)
+        if etag is not None:
+            with self._memo_lock:
+                memo = self._memo.get(memo_key)
+                if memo is not None and memo[0] == etag:
+                    self._memo.move_to_end(memo_key)
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug(SquirrelMessage(tree="S3Tree", acorn=table_name, message="memo hit").to_json())
+                    return memo[1].copy()
 
         try:
-            query = f"""
-                SELECT * FROM read_parquet(
-                    's3://{self.bucket}/{s3_key}'
-                )
-            """
-            result = duckdb.query(query).to_df()
+            query = f"SELECT {col_expr} FROM read_parquet($path)"
+            result = _duckdb_query(query, params={"path": f"s3://{self.bucket}/{s3_key}"}).to_df()
             logging.info(
                 SquirrelMessage(
                     tree="S3Tree", acorn=table_name, message=f"Retrieved cache from s3://{self.bucket}/{s3_key}"
                 ).to_json()
             )
-            return result
         except Exception as e:
             logging.warning(
                 SquirrelMessage(
@@ -130,6 +217,31 @@ class S3Tree(Tree):
             )
             return pd.DataFrame()
 
+        if etag is None:
+            return result
+        with self._memo_lock:
+            self._memo[memo_key] = (etag, result)
+            self._memo.move_to_end(memo_key)
+            while len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+        return result.copy()
+
+    def _etag(self, table_name: str, s3_key: str) -> str | None:
+        """Return the ETag of a cached object, or None if the HEAD request fails."""
+        try:
+            return self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)["ETag"]
+        except Exception as e:
+            logging.debug(
+                SquirrelMessage(tree="S3Tree", acorn=table_name, message=f"Skipping memo for {s3_key}: {e}").to_json()
+            )
+            return None
+
+    def _forget(self, table_name: str) -> None:
+        """Drop memoized reads of a table after it has been rewritten."""
+        with self._memo_lock:
+            for key in [key for key in self._memo if key[0] == table_name]:
+                del self._memo[key]
+
     def get_location(self, table_name: str, partitioned: bool = False) -> str:
         """Return the S3 URI for a given table."""
         if partitioned:
@@ -159,26 +271,19 @@ class S3Tree(Tree):
         response = self.s3_client.get_object(Bucket=self.bucket, Key=s3_key)
         return response["Body"].read().decode()
 
-    def _scurry_multiple(self, table_names: list[str]) -> pd.DataFrame:
+    def _scurry_multiple(self, table_names: list[str], columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch and merge multiple tables from S3."""
-        parquet_paths = []
-        asset_names = []
-
-        for tbl_name in table_names:
-            filename = prefix_table_name(tbl_name)
-            s3_key = get_s3_cache_path(filename)
-            s3_path = f"s3://{self.bucket}/{s3_key}"
-            parquet_paths.append(f"'{s3_path}'")
-            asset_names.append(tbl_name)
+        col_expr = _column_list(columns, all_columns="* EXCLUDE (filename)")
+        paths = [f"s3://{self.bucket}/{get_s3_cache_path(prefix_table_name(tbl_name))}" for tbl_name in table_names]
 
         try:
-            union_query = " UNION ALL ".join(
-                [
-                    f"SELECT *, '{asset}' as asset_name FROM read_parquet({path})"
-                    for path, asset in zip(parquet_paths, asset_names, strict=False)
-                ]
-            )
-            result = duckdb.query(union_query).to_df()
+            # One scan over every file lets DuckDB read them in parallel; the filename
+            # column it adds is mapped back to the table each row came from
+            query = f"""
+                SELECT {col_expr}, list_extract($assets, list_position($paths, filename)) AS asset_name
+                FROM read_parquet($paths, filename=true)
+            """
+            result = _duckdb_query(query, params={"paths": paths, "assets": list(table_names)}).to_df()
             logging.info(
                 SquirrelMessage(
                     tree="S3Tree", acorn="merged", message=f"Merged {len(table_names)} tables from S3"
@@ -210,24 +315,28 @@ class MemoryTree(Tree):
         )
         self._store[table_name] = data
 
-    def scurry(self, table_name: str | list[str]) -> pd.DataFrame:
+    def scurry(self, table_name: str | list[str], columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch DataFrame from memory.
 
         When given a list of table names, merges them and adds
-        an 'asset_name' column.
+        an 'asset_name' column. When columns is given, only those
+        columns are returned.
         """
         if isinstance(table_name, list):
-            return self._scurry_multiple(table_name)
-        return self._scurry_single(table_name)
+            return self._scurry_multiple(table_name, columns)
+        return self._scurry_single(table_name, columns)
 
-    def _scurry_single(self, table_name: str) -> pd.DataFrame:
+    def _scurry_single(self, table_name: str, columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch a single table from memory."""
         logging.info(
             SquirrelMessage(
                 tree="MemoryTree", acorn=table_name, message=f"Fetching cache from memory for {table_name}"
             ).to_json()
         )
-        return self._store.get(table_name, pd.DataFrame())
+        df = self._store.get(table_name, pd.DataFrame())
+        if columns and not df.empty:
+            return df[columns]
+        return df
 
     def get_location(self, table_name: str, partitioned: bool = False) -> str:
         """Return the in-memory identifier for a given table."""
@@ -246,15 +355,14 @@ class MemoryTree(Tree):
         """Read a JSON string from the in-memory JSON store."""
         return self._json_store.get(key, "{}")
 
-    def _scurry_multiple(self, table_names: list[str]) -> pd.DataFrame:
+    def _scurry_multiple(self, table_names: list[str], columns: list[str] | None = None) -> pd.DataFrame:
         """Fetch and merge multiple tables from memory."""
         dfs = []
         for tbl_name in table_names:
             df = self._store.get(tbl_name, pd.DataFrame())
             if not df.empty:
-                df = df.copy()
-                df["asset_name"] = tbl_name
-                dfs.append(df)
+                # assign() tags rows on a shallow copy, leaving the stored frame's data unduplicated
+                dfs.append((df[columns] if columns else df).assign(asset_name=tbl_name))
 
         if not dfs:
             logging.warning(
@@ -12,6 +12,8 @@ from .acorn_helpers.unique_subject_ids import unique_subject_ids_columns
 from .acorns import ACORN_REGISTRY, NAMES, TREE
 from .squirrel import Acorn, AcornType, Squirrel
 
+QC_MAX_WORKERS = 32
+
 
 def publish_squirrel_metadata() -> None:
     """Build and publish a Squirrel metadata JSON to the cache root.
@@ -85,25 +87,34 @@ def publish_squirrel_metadata() -> None:
 def hide_acorns():
     """Trigger force update of all registered acorn functions.
 
-    Updates each acorn individually. For the QC acorn, fetches
+    Updates the independent acorns concurrently. For the QC acorn, fetches
     unique subject IDs from asset_basics and updates each individually,
     using parallelization when multiple subjects are available.
     After all updates, publishes Squirrel metadata JSON to the cache root.
     """
-    ACORN_REGISTRY[NAMES["upn"]](force_update=True)
-    ACORN_REGISTRY[NAMES["usi"]](force_update=True)
-
-    df_basics = ACORN_REGISTRY[NAMES["basics"]](force_update=True)
+    # These acorns don't read each other's caches, so their DocDB round-trips can overlap.
+    # metadata_upgrade merges against the asset_basics cache, so it only starts once
+    # basics has been rebuilt
+    with ThreadPoolExecutor() as executor:
+        refreshes = {
+            name: executor.submit(ACORN_REGISTRY[NAMES[name]], force_update=True)
+            for name in ("upn", "usi", "basics", "d2r")
+        }
+        refreshes["basics"].result()
+        refreshes["upgrade"] = executor.submit(ACORN_REGISTRY[NAMES["upgrade"]], force_update=True)
+        for future in refreshes.values():
+            future.result()
 
-    ACORN_REGISTRY[NAMES["d2r"]](force_update=True)
-    ACORN_REGISTRY[NAMES["upgrade"]](force_update=True)
+    df_basics = refreshes["basics"].result()
 
     subject_ids = df_basics["subject_id"].dropna().unique()
 
     if len(subject_ids) > 0:
         qc_acorn = ACORN_REGISTRY[NAMES["qc"]]
+        # Enough workers to keep S3 busy for large subject lists without exhausting the client's connection pool
+        max_workers = min(QC_MAX_WORKERS, max(4, len(subject_ids) // 4))
         try:
-            with ThreadPoolExecutor() as executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = [
                     executor.submit(qc_acorn, subject_id=subject_id, force_update=True) for subject_id in subject_ids
                 ]
@@ -36,7 +36,7 @@ def prefix_table_name(table_name: str) -> str:
         Filename with 'zs_' prefix and '.pqt' extension.
 
     """
-    return "zs_" + table_name + ".pqt"
+    return f"zs_{table_name}.pqt"
 
 
 def get_s3_cache_path(filename: str) -> str:
@@ -11,9 +11,9 @@ from zombie_squirrel.acorn_helpers.asset_basics import asset_basics
 class TestAssetBasics(unittest.TestCase):
     """Tests for asset_basics acorn."""
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_cache_hit(self, mock_tree, mock_client_class):
+    def test_asset_basics_cache_hit(self, mock_tree, mock_get_client):
         """Test returning cached asset basics."""
         cached_df = pd.DataFrame(
             {
@@ -39,7 +39,7 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(len(result), 2)
         self.assertListEqual(list(result["_id"]), ["id1", "id2"])
-        mock_client_class.assert_not_called()
+        mock_get_client.assert_not_called()
 
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
     def test_asset_basics_empty_cache_raises_error(self, mock_tree):
@@ -52,13 +52,13 @@ class TestAssetBasics(unittest.TestCase):
         self.assertIn("Cache is empty", str(context.exception))
         self.assertIn("force_update=True", str(context.exception))
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_cache_miss(self, mock_tree, mock_client_class):
+    def test_asset_basics_cache_miss(self, mock_tree, mock_get_client):
         """Test fetching asset basics when cache is empty."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -84,13 +84,13 @@ class TestAssetBasics(unittest.TestCase):
         self.assertEqual(result.iloc[0]["modalities"], "img")
         self.assertEqual(result.iloc[0]["project_name"], "proj1")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_with_data_processes(self, mock_tree, mock_client_class):
+    def test_asset_basics_with_data_processes(self, mock_tree, mock_get_client):
         """Test asset_basics includes process_date from data_processes."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -121,13 +121,13 @@ class TestAssetBasics(unittest.TestCase):
         self.assertEqual(result.iloc[0]["_id"], "id1")
         self.assertEqual(result.iloc[0]["process_date"], "2023-01-20")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_incremental_update(self, mock_tree, mock_client_class):
+    def test_asset_basics_incremental_update(self, mock_tree, mock_get_client):
         """Test incremental cache update with partial data refresh."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.side_effect = [
             [
@@ -157,13 +157,38 @@ class TestAssetBasics(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]["_id"], "id2")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_with_other_identifiers_no_code_ocean(self, mock_tree, mock_client_class):
+    def test_asset_basics_sorted_by_last_modified(self, mock_tree, mock_get_client):
+        """Test the stored table is ordered by _last_modified."""
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.side_effect = [
+            [
+                {"_id": "id1", "_last_modified": "2023-01-03"},
+                {"_id": "id2", "_last_modified": "2023-01-01"},
+                {"_id": "id3", "_last_modified": "2023-01-02"},
+            ],
+            [
+                {"_id": "id1", "_last_modified": "2023-01-03"},
+                {"_id": "id2", "_last_modified": "2023-01-01"},
+                {"_id": "id3", "_last_modified": "2023-01-02"},
+            ],
+        ]
+
+        result = asset_basics(force_update=True)
+
+        self.assertListEqual(result["_id"].tolist(), ["id2", "id3", "id1"])
+        stored = mock_tree.hide.call_args[0][1]
+        self.assertListEqual(stored["_last_modified"].tolist(), ["2023-01-01", "2023-01-02", "2023-01-03"])
+
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
+    def test_asset_basics_with_other_identifiers_no_code_ocean(self, mock_tree, mock_get_client):
         """Test asset_basics when other_identifiers exists but has no Code Ocean."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -189,13 +214,13 @@ class TestAssetBasics(unittest.TestCase):
         self.assertEqual(result.iloc[0]["_id"], "id1")
         self.assertIsNone(result.iloc[0]["code_ocean"])
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_asset_basics_with_code_ocean_identifier(self, mock_tree, mock_client_class):
+    def test_asset_basics_with_code_ocean_identifier(self, mock_tree, mock_get_client):
         """Test asset_basics when other_identifiers contains Code Ocean."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -221,13 +246,13 @@ class TestAssetBasics(unittest.TestCase):
         self.assertEqual(result.iloc[0]["_id"], "id1")
         self.assertEqual(result.iloc[0]["code_ocean"], ["df429003-91a0-45d2-8457-66b156ad8bfa"])
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_age_calculated_from_date_of_birth(self, mock_tree, mock_client_class):
+    def test_age_calculated_from_date_of_birth(self, mock_tree, mock_get_client):
         """Test age is calculated in days from date_of_birth."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -244,13 +269,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["age"], 151)
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_age_calculated_from_year_of_birth(self, mock_tree, mock_client_class):
+    def test_age_calculated_from_year_of_birth(self, mock_tree, mock_get_client):
         """Test age is calculated in days from Jan 1 of year_of_birth when no date_of_birth."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -267,13 +292,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["age"], 151)
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_age_none_when_no_birth_info(self, mock_tree, mock_client_class):
+    def test_age_none_when_no_birth_info(self, mock_tree, mock_get_client):
         """Test age is None when no birth info is available."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -287,13 +312,36 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertIsNone(result.iloc[0]["age"])
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_acquisition_type_stored(self, mock_tree, mock_client_class):
+    def test_age_none_when_birth_date_unparseable(self, mock_tree, mock_get_client):
+        """Test age is None when date_of_birth cannot be parsed."""
+        mock_tree.scurry.return_value = pd.DataFrame()
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.return_value = [
+            {
+                "_id": "id1",
+                "_last_modified": "2023-01-01",
+                "data_description": {},
+                "acquisition": {
+                    "acquisition_start_time": "2023-06-01T00:00:00",
+                    "subject_details": {"date_of_birth": "not-a-date"},
+                },
+            }
+        ]
+
+        result = asset_basics(force_update=True)
+
+        self.assertIsNone(result.iloc[0]["age"])
+
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
+    def test_acquisition_type_stored(self, mock_tree, mock_get_client):
         """Test acquisition_type is stored from acquisition.acquisition_type."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -307,13 +355,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["acquisition_type"], "multiplane-2photon")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_experimenters_stored_as_comma_separated(self, mock_tree, mock_client_class):
+    def test_experimenters_stored_as_comma_separated(self, mock_tree, mock_get_client):
         """Test experimenters are joined as comma-separated string."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -327,13 +375,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["experimenters"], "huy.nguyen, jane.doe")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_experimenters_stored_as_comma_separated_dicts(self, mock_tree, mock_client_class):
+    def test_experimenters_stored_as_comma_separated_dicts(self, mock_tree, mock_get_client):
         """Test experimenters handles list of person dicts by extracting name."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -352,13 +400,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["experimenters"], "Jane Doe, John Smith")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_experimenters_empty_when_missing(self, mock_tree, mock_client_class):
+    def test_experimenters_empty_when_missing(self, mock_tree, mock_get_client):
         """Test experimenters is empty string when not present."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -372,13 +420,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["experimenters"], "")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_instrument_id_stored(self, mock_tree, mock_client_class):
+    def test_instrument_id_stored(self, mock_tree, mock_get_client):
         """Test instrument_id is stored from acquisition.instrument_id."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -392,13 +440,13 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertEqual(result.iloc[0]["instrument_id"], "4A")
 
-    @patch("zombie_squirrel.acorn_helpers.asset_basics.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
-    def test_instrument_id_none_when_missing(self, mock_tree, mock_client_class):
+    def test_instrument_id_none_when_missing(self, mock_tree, mock_get_client):
         """Test instrument_id is None when not present."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "_id": "id1",
@@ -412,6 +460,66 @@ class TestAssetBasics(unittest.TestCase):
 
         self.assertIsNone(result.iloc[0]["instrument_id"])
 
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
+    def test_batches_with_different_fields_are_combined(self, mock_tree, mock_get_client):
+        """Test that per-batch frames with differing columns are merged into one table."""
+        mock_tree.scurry.return_value = pd.DataFrame()
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        ids = [f"id{i}" for i in range(150)]
+
+        def retrieve(filter_query, projection, limit):
+            if "_id" not in filter_query:
+                return [{"_id": _id, "_last_modified": "2023-01-01"} for _id in ids]
+            batch = filter_query["_id"]["$in"]
+            if batch[0] == "id0":
+                return [{"_id": _id, "_last_modified": "2023-01-01"} for _id in batch]
+            return [
+                {"_id": _id, "_last_modified": "2023-01-01", "acquisition": {"instrument_id": "4A"}} for _id in batch
+            ]
+
+        mock_client_instance.retrieve_docdb_records.side_effect = retrieve
+
+        result = asset_basics(force_update=True)
+
+        self.assertEqual(len(result), 150)
+        self.assertListEqual(list(result["_id"]), ids)
+        self.assertTrue(pd.isna(result.iloc[0]["instrument_id"]))
+        self.assertEqual(result.iloc[149]["instrument_id"], "4A")
+
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
+    def test_no_records_returns_empty_table(self, mock_tree, mock_get_client):
+        """Test that a refresh with no records still stores an empty table."""
+        mock_tree.scurry.return_value = pd.DataFrame()
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.return_value = []
+
+        result = asset_basics(force_update=True)
+
+        self.assertTrue(result.empty)
+        self.assertIn("instrument_id", result.columns)
+        mock_tree.hide.assert_called_once()
+
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.asset_basics.acorns.TREE")
+    def test_batch_error_propagates_without_refetch(self, mock_tree, mock_get_client):
+        """Test a failing batch raises instead of re-running every batch sequentially."""
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.side_effect = [
+            [{"_id": "id1", "_last_modified": "2023-01-01"}],
+            ConnectionError("DocDB unavailable"),
+        ]
+
+        with self.assertRaises(ConnectionError):
+            asset_basics(force_update=True)
+
+        self.assertEqual(mock_client_instance.retrieve_docdb_records.call_count, 2)
+        mock_tree.hide.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,11 +10,13 @@ from zombie_squirrel.acorn_helpers.assets_smartspim import (
     _fetch_asset_metadata,
     _list_channels,
     _quantification_link,
+    _s3_client,
     _segmentation_link,
     _stitched_link,
     assets_smartspim,
     assets_smartspim_columns,
 )
+from zombie_squirrel.forest import S3_CLIENT_CONFIG
 
 LOCATION = "s3://aind-open-data/SmartSPIM_123_2026-01-01_00-00-00_stitched_2026-01-02_00-00-00"
 
@@ -42,24 +44,30 @@ EXAMPLE_RECORD = {
 class TestLinkHelpers(unittest.TestCase):
     def test_stitched_link(self):
         result = _stitched_link(LOCATION)
-        self.assertEqual(result, f"https://neuroglancer-demo.appspot.com/#!{LOCATION}/neuroglancer_config.json")
+        self.assertEqual(result, f"https://allen.neuroglass.io/new#!{LOCATION}/neuroglancer_config.json")
 
     def test_segmentation_link(self):
         result = _segmentation_link(LOCATION, "Ex_561_Em_600")
         self.assertEqual(
             result,
-            f"https://neuroglancer-demo.appspot.com/#!{LOCATION}/image_cell_segmentation/Ex_561_Em_600/visualization/neuroglancer_config.json",
+            f"https://allen.neuroglass.io/new#!{LOCATION}/image_cell_segmentation/Ex_561_Em_600/visualization/neuroglancer_config.json",
         )
 
     def test_quantification_link(self):
         result = _quantification_link(LOCATION, "Ex_561_Em_600")
         self.assertEqual(
             result,
-            f"https://neuroglancer-demo.appspot.com/#!{LOCATION}/image_cell_quantification/Ex_561_Em_600/visualization/neuroglancer_config.json",
+            f"https://allen.neuroglass.io/new#!{LOCATION}/image_cell_quantification/Ex_561_Em_600/visualization/neuroglancer_config.json",
         )
 
 
 class TestListChannels(unittest.TestCase):
+    def setUp(self):
+        _s3_client.cache_clear()
+
+    def tearDown(self):
+        _s3_client.cache_clear()
+
     @patch("zombie_squirrel.acorn_helpers.assets_smartspim.boto3.client")
     def test_returns_channel_names(self, mock_boto_client):
         mock_s3 = MagicMock()
@@ -90,12 +98,21 @@ class TestListChannels(unittest.TestCase):
 
         self.assertEqual(result, [])
 
+    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.boto3.client")
+    def test_reuses_s3_client(self, mock_boto_client):
+        mock_boto_client.return_value.list_objects_v2.return_value = {}
+
+        _list_channels(LOCATION)
+        _list_channels(LOCATION)
+
+        mock_boto_client.assert_called_once_with("s3", config=S3_CLIENT_CONFIG)
+
 
 class TestFetchAssetMetadata(unittest.TestCase):
-    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.MetadataDbClient")
-    def test_returns_dict_keyed_by_name(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.acorns.get_metadata_client")
+    def test_returns_dict_keyed_by_name(self, mock_get_client):
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
         mock_client.retrieve_docdb_records.return_value = [EXAMPLE_RECORD]
 
         result = _fetch_asset_metadata(["SmartSPIM_123_2026-01-01_00-00-00_stitched_2026-01-02_00-00-00"])
@@ -103,10 +120,10 @@ class TestFetchAssetMetadata(unittest.TestCase):
         self.assertIn("SmartSPIM_123_2026-01-01_00-00-00_stitched_2026-01-02_00-00-00", result)
         self.assertEqual(result["SmartSPIM_123_2026-01-01_00-00-00_stitched_2026-01-02_00-00-00"]["_id"], "abc123")
 
-    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.MetadataDbClient")
-    def test_passes_correct_filter(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.acorns.get_metadata_client")
+    def test_passes_correct_filter(self, mock_get_client):
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
         mock_client.retrieve_docdb_records.return_value = []
 
         names = ["asset_a", "asset_b"]
@@ -115,10 +132,10 @@ class TestFetchAssetMetadata(unittest.TestCase):
         call_kwargs = mock_client.retrieve_docdb_records.call_args[1]
         self.assertEqual(call_kwargs["filter_query"], {"name": {"$in": names}})
 
-    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.MetadataDbClient")
-    def test_batches_large_requests(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.assets_smartspim.acorns.get_metadata_client")
+    def test_batches_large_requests(self, mock_get_client):
         mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
         mock_client.retrieve_docdb_records.return_value = []
 
         names = [f"asset_{i}" for i in range(250)]
@@ -307,6 +324,7 @@ class TestAssetsSmartspim(unittest.TestCase):
         raw_to_stitched_arg = mock_build.call_args[0][0]
         self.assertIn("SmartSPIM_raw_2026-01-01_00-00-00", raw_to_stitched_arg)
         self.assertIsNone(raw_to_stitched_arg["SmartSPIM_raw_2026-01-01_00-00-00"])
+        self.assertListEqual(result["processed"].tolist(), [False])
         mock_tree.hide.assert_called_once()
 
     @patch("zombie_squirrel.acorn_helpers.assets_smartspim.source_data")
@@ -0,0 +1,126 @@
+"""Unit tests for metadata_upgrade acorn."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+import zombie_squirrel.acorns as acorns
+from zombie_squirrel.acorn_helpers.metadata_upgrade import metadata_upgrade, metadata_upgrade_columns
+from zombie_squirrel.forest import MemoryTree
+
+
+def _raw_upgrade_status() -> pd.DataFrame:
+    """Return a custom upgrade status table with one upgraded and one failed asset."""
+    return pd.DataFrame(
+        {
+            "v1_id": ["v1a", "v1b"],
+            "v2_id": ["v2a", None],
+            "upgrader_version": ["1.0", "1.0"],
+            "status": ["success", "failed"],
+            "last_modified": ["2025-01-01", "2025-01-01"],
+            "upgrade_datetime": ["2025-01-02", "2025-01-02"],
+        }
+    )
+
+
+class TestMetadataUpgrade(unittest.TestCase):
+    """Tests for metadata_upgrade acorn."""
+
+    def setUp(self):
+        """Set up an in-memory tree holding the custom table and asset basics."""
+        self.tree = MemoryTree()
+        self.tree.hide("metadata_upgrade_status_prod", _raw_upgrade_status())
+        self.tree.hide(
+            acorns.NAMES["basics"],
+            pd.DataFrame({"_id": ["v2a"], "name": ["asset-a"], "project_name": ["P"], "data_level": ["raw"]}),
+        )
+        patcher = patch("zombie_squirrel.acorn_helpers.metadata_upgrade.acorns.TREE", self.tree)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _mock_v1_client(self, mock_get_client, records):
+        """Return a mocked v1 DocDB client returning the given records."""
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.return_value = records
+        return mock_client_instance
+
+    def test_cache_hit(self):
+        """Test returning cached upgrade status without recalculating."""
+        cached_df = pd.DataFrame({"_id": ["v1a"], "1.0": ["success"]})
+        self.tree.hide("metadata_upgrade", cached_df)
+
+        result = metadata_upgrade()
+
+        pd.testing.assert_frame_equal(result, cached_df)
+
+    def test_empty_cache_raises_error(self):
+        """Test that an empty cache raises without force_update."""
+        with self.assertRaises(ValueError):
+            metadata_upgrade()
+
+    def test_missing_custom_table_returns_empty(self):
+        """Test that a missing custom table returns an empty DataFrame."""
+        self.tree = MemoryTree()
+        with patch("zombie_squirrel.acorn_helpers.metadata_upgrade.acorns.TREE", self.tree):
+            result = metadata_upgrade(force_update=True)
+
+        self.assertTrue(result.empty)
+
+    def test_missing_upgrader_version_returns_empty(self):
+        """Test that a custom table without upgrader_version returns an empty DataFrame."""
+        self.tree.hide("metadata_upgrade_status_prod", _raw_upgrade_status().drop(columns=["upgrader_version"]))
+
+        result = metadata_upgrade(force_update=True)
+
+        self.assertTrue(result.empty)
+
+    @patch("zombie_squirrel.acorn_helpers.metadata_upgrade.acorns.get_metadata_client")
+    def test_force_update_joins_v2_basics_and_v1_records(self, mock_get_client):
+        """Test upgraded assets take names from basics and failed ones from v1 DocDB."""
+        mock_client_instance = self._mock_v1_client(
+            mock_get_client,
+            [{"_id": "v1b", "name": "asset-b", "data_description": {"data_level": "raw", "project_name": "Q"}}],
+        )
+
+        result = metadata_upgrade(force_update=True).set_index("_id")
+
+        mock_get_client.assert_called_once_with("v1")
+        self.assertEqual(
+            mock_client_instance.retrieve_docdb_records.call_args.kwargs["filter_query"], {"_id": {"$in": ["v1b"]}}
+        )
+        self.assertEqual(result.loc["v1a", "name"], "asset-a")
+        self.assertEqual(result.loc["v1b", "name"], "asset-b")
+        self.assertEqual(result.loc["v1b", "project_name"], "Q")
+        self.assertEqual(result.loc["v1a", "1.0"], "success")
+        pd.testing.assert_frame_equal(self.tree.scurry("metadata_upgrade").set_index("_id"), result)
+
+    @patch("zombie_squirrel.acorn_helpers.metadata_upgrade.acorns.get_metadata_client")
+    def test_force_update_keeps_previous_versions(self, mock_get_client):
+        """Test earlier version columns are kept and the current version is overwritten."""
+        self._mock_v1_client(mock_get_client, [])
+        self.tree.hide(
+            "metadata_upgrade",
+            pd.DataFrame(
+                {"_id": ["v1a", "v1b"], "0.9": ["failed", "failed"], "1.0": ["old", "old"], "name": ["x", "y"]}
+            ),
+        )
+
+        result = metadata_upgrade(force_update=True).set_index("_id")
+
+        self.assertEqual(result.loc["v1a", "0.9"], "failed")
+        self.assertEqual(result.loc["v1a", "1.0"], "success")
+        self.assertEqual(result.loc["v1b", "1.0"], "failed")
+        self.assertNotIn("1.0_new", result.columns)
+        self.assertTrue(pd.isna(result.loc["v1b", "name"]))
+
+    def test_columns(self):
+        """Test metadata upgrade column definitions include the asset identifiers."""
+        names = [col.name for col in metadata_upgrade_columns()]
+        for expected in ("_id", "v2_id", "name", "status"):
+            self.assertIn(expected, names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,14 @@
 """Unit tests for QC acorn."""
 
 import unittest
+from collections import OrderedDict
+from enum import Enum
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
 import zombie_squirrel.acorns as acorns
-from zombie_squirrel.acorn_helpers.qc import qc
+from zombie_squirrel.acorn_helpers.qc import _filter_by_asset_names, qc
 from zombie_squirrel.forest import MemoryTree
 
 
@@ -14,14 +16,14 @@ class TestQCMemoryTree(unittest.TestCase):
     """Tests for QC acorn with in-memory tree."""
 
     def setUp(self):
-        """Set up in-memory tree and mock MetadataDbClient."""
+        """Set up in-memory tree and mock metadata client."""
         acorns.TREE = MemoryTree()
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_cache_miss_with_force_update(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_cache_miss_with_force_update(self, mock_get_client):
         """Test fetching QC data when cache is empty with force_update."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -76,9 +78,13 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(df.iloc[0]["name"], "Test Metric 1")
         self.assertEqual(df.iloc[1]["name"], "Test Metric 2")
         self.assertEqual(df.iloc[0]["value"], "{dict}")
+        self.assertTrue(pd.isna(df.iloc[1]["value"]))
+        self.assertListEqual(df["modality"].tolist(), ["tm", "tm2"])
+        for col in ("name", "value", "asset_name", "stage", "modality"):
+            self.assertNotIsInstance(df[col].dtype, pd.CategoricalDtype)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_cache_hit(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_cache_hit(self, mock_get_client):
         """Test returning cached QC data without refetch."""
         cache_df = pd.DataFrame(
             {
@@ -93,7 +99,7 @@ class TestQCMemoryTree(unittest.TestCase):
 
         self.assertEqual(len(df), 2)
         self.assertEqual(df.iloc[0]["name"], "Metric 1")
-        mock_client_class.assert_not_called()
+        mock_get_client.assert_not_called()
 
     def test_qc_empty_cache_raises_error(self):
         """Test that empty cache logs error and returns empty dataframe without force_update."""
@@ -101,22 +107,22 @@ class TestQCMemoryTree(unittest.TestCase):
 
         self.assertTrue(df.empty)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_no_record_found(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_no_record_found(self, mock_get_client):
         """Test handling when asset record not found in database."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = []
 
         df = qc("missing-asset", force_update=True)
 
         self.assertTrue(df.empty)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_no_metrics_in_record(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_no_metrics_in_record(self, mock_get_client):
         """Test handling when quality_control has no metrics."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -130,11 +136,11 @@ class TestQCMemoryTree(unittest.TestCase):
 
         self.assertTrue(df.empty)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_dict_value_replaced_and_no_tags_column(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_dict_value_replaced_and_no_tags_column(self, mock_get_client):
         """Test that dict values are replaced with {dict} and tags column is absent."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -164,11 +170,26 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(df.iloc[0]["value"], "{dict}")
         self.assertNotIn("tags", df.columns)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_cache_persistence(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_projection_limited_to_metric_fields(self, mock_get_client):
+        """Test that only the metric fields used in the table are requested."""
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.return_value = []
+
+        qc("test-asset", force_update=True)
+
+        projection = mock_client_instance.retrieve_docdb_records.call_args.kwargs["projection"]
+        self.assertNotIn("quality_control", projection)
+        self.assertIn("quality_control.metrics.value", projection)
+        self.assertIn("quality_control.metrics.object_type", projection)
+        self.assertNotIn("quality_control.metrics.status_history", projection)
+
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_cache_persistence(self, mock_get_client):
         """Test that QC data is cached after first fetch."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -200,11 +221,11 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(df2.iloc[0]["name"], "Persistent Metric")
         mock_client_instance.retrieve_docdb_records.assert_not_called()
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_multiple_assets_merge(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_multiple_assets_merge(self, mock_get_client):
         """Test fetching and merging QC data for multiple assets."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         # Single call returns all records for the subject
         mock_client_instance.retrieve_docdb_records.return_value = [
@@ -251,8 +272,8 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(df[df["name"] == "Metric A"].iloc[0]["asset_name"], "asset1")
         self.assertEqual(df[df["name"] == "Metric B"].iloc[0]["asset_name"], "asset2")
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_multiple_assets_from_cache(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_multiple_assets_from_cache(self, mock_get_client):
         """Test retrieving multiple cached assets merges them."""
         cache_df1 = pd.DataFrame(
             {
@@ -279,7 +300,7 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(len(df), 2)
         self.assertIn("asset_name", df.columns)
         self.assertListEqual(sorted(df["asset_name"].unique().tolist()), ["asset1", "asset2"])
-        mock_client_class.assert_not_called()
+        mock_get_client.assert_not_called()
 
     def test_qc_multiple_empty_assets_no_force_update(self):
         """Test multiple assets with empty cache and no force_update."""
@@ -287,11 +308,11 @@ class TestQCMemoryTree(unittest.TestCase):
 
         self.assertTrue(df.empty)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_single_asset_name_string(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_single_asset_name_string(self, mock_get_client):
         """Test filtering with a single asset name as string instead of list."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -336,11 +357,11 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(df.iloc[0]["name"], "Metric A")
         self.assertEqual(df.iloc[0]["asset_name"], "asset1")
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_missing_asset_names(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_missing_asset_names(self, mock_get_client):
         """Test requesting non-existent asset names triggers warning."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -367,11 +388,24 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(len(df), 1)
         self.assertEqual(df.iloc[0]["name"], "Metric A")
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_numeric_value_converted_to_string(self, mock_client_class):
+    def test_filter_by_asset_names_object_and_categorical(self):
+        """Test asset name filtering gives the same rows for object and categorical columns."""
+        df = pd.DataFrame({"asset_name": ["asset1", "asset2", "asset1"], "name": ["A", "B", "C"]})
+
+        for frame in (df, df.astype({"asset_name": "category"})):
+            with self.subTest(dtype=str(frame["asset_name"].dtype)):
+                with self.assertLogs(level="WARNING") as logs:
+                    result = _filter_by_asset_names(frame, ["asset1", "nonexistent"], "test-subject")
+
+                self.assertListEqual(result["name"].tolist(), ["A", "C"])
+                self.assertListEqual(result["asset_name"].tolist(), ["asset1", "asset1"])
+                self.assertIn("nonexistent", logs.output[0])
+
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_numeric_value_converted_to_string(self, mock_get_client):
         """Test that numeric values in QC metrics are converted to strings."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -398,6 +432,69 @@ class TestQCMemoryTree(unittest.TestCase):
         self.assertEqual(len(df), 1)
         self.assertEqual(df.iloc[0]["value"], "42")
 
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_value_subclasses_encoded_like_base_type(self, mock_get_client):
+        """Test that dict and str subclasses are encoded like plain dicts and strings."""
+
+        class Status(str, Enum):
+            PASS = "Pass"
+
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+
+        metric = {
+            "object_type": "QC metric",
+            "stage": "Processing",
+            "modality": None,
+            "tags": None,
+            "status_history": [],
+        }
+        mock_client_instance.retrieve_docdb_records.return_value = [
+            {
+                "_id": "test-asset-001",
+                "name": "test-asset",
+                "quality_control": {
+                    "metrics": [
+                        {**metric, "name": "Ordered Metric", "value": OrderedDict(value="pass")},
+                        {**metric, "name": "Enum Metric", "value": Status.PASS},
+                    ]
+                },
+            }
+        ]
+
+        df = qc("test-asset", force_update=True)
+
+        self.assertListEqual(df["value"].tolist(), ["{dict}", "Pass"])
+
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_unhashable_stage_and_modality_kept(self, mock_get_client):
+        """Test that dict and list stage/modality values are passed through unchanged."""
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+
+        mock_client_instance.retrieve_docdb_records.return_value = [
+            {
+                "_id": "test-asset-001",
+                "name": "test-asset",
+                "quality_control": {
+                    "metrics": [
+                        {
+                            "object_type": "QC metric",
+                            "name": "Odd Metric",
+                            "stage": {"name": "Processing"},
+                            "modality": {"abbreviation": {"name": "ecephys"}},
+                            "value": "pass",
+                        }
+                    ]
+                },
+            }
+        ]
+
+        df = qc("test-asset", force_update=True)
+
+        self.assertEqual(df.iloc[0]["stage"], {"name": "Processing"})
+        self.assertEqual(df.iloc[0]["modality"], {"name": "ecephys"})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 
 import zombie_squirrel.acorns as acorns
-from zombie_squirrel.acorn_helpers.qc import qc
+from zombie_squirrel.acorn_helpers.qc import qc, qc_columns
 from zombie_squirrel.forest import MemoryTree
 
 
@@ -14,14 +14,14 @@ class TestQCCoverageLazy(unittest.TestCase):
     """Tests for QC acorn lazy=True mode."""
 
     def setUp(self):
-        """Set up in-memory tree and mock MetadataDbClient."""
+        """Set up in-memory tree and mock metadata client."""
         acorns.TREE = MemoryTree()
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_lazy_with_force_update(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_lazy_with_force_update(self, mock_get_client):
         """Test lazy=True with force_update=True fetches and returns path."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -72,11 +72,11 @@ class TestQCCoverageColumnDropping(unittest.TestCase):
         """Set up in-memory tree."""
         acorns.TREE = MemoryTree()
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_columns_in_output(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_columns_in_output(self, mock_get_client):
         """Test that expected columns are present in output."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -107,11 +107,11 @@ class TestQCCoverageColumnDropping(unittest.TestCase):
         for col in expected_cols:
             self.assertIn(col, df.columns)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_drops_unwanted_columns(self, mock_client_class):
-        """Test that object_type and status_history columns are dropped if present."""
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_columns_match_definitions(self, mock_get_client):
+        """Test that only the projected metric fields and the asset columns are produced."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -136,13 +136,9 @@ class TestQCCoverageColumnDropping(unittest.TestCase):
             }
         ]
 
-        original_fields = ["name", "modality", "stage", "value", "status_history"]
-        with patch("zombie_squirrel.acorn_helpers.qc.QC_METRIC_FIELDS", original_fields + ["object_type"]):
-            df = qc("test-subject", force_update=True)
+        df = qc("test-subject", force_update=True)
 
-        self.assertNotIn("object_type", df.columns)
-        self.assertNotIn("status_history", df.columns)
-        self.assertIn("name", df.columns)
+        self.assertListEqual(sorted(df.columns), sorted(col.name for col in qc_columns()))
 
 
 class TestQCCoverageTimestamp(unittest.TestCase):
@@ -152,11 +148,11 @@ class TestQCCoverageTimestamp(unittest.TestCase):
         """Set up in-memory tree."""
         acorns.TREE = MemoryTree()
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_timestamp_parsing_with_z_suffix(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_timestamp_parsing_with_z_suffix(self, mock_get_client):
         """Test timestamp parsing with Z suffix."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -190,11 +186,11 @@ class TestQCCoverageTimestamp(unittest.TestCase):
         self.assertIsNotNone(df.iloc[0]["timestamp"])
         self.assertEqual(df.iloc[0]["timestamp"].year, 2025)
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_timestamp_parsing_invalid_format(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_timestamp_parsing_invalid_format(self, mock_get_client):
         """Test timestamp parsing with invalid format handles gracefully."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
@@ -227,11 +223,11 @@ class TestQCCoverageTimestamp(unittest.TestCase):
         self.assertEqual(len(df), 1)
         self.assertTrue(pd.isna(df.iloc[0]["timestamp"]))
 
-    @patch("zombie_squirrel.acorn_helpers.qc.MetadataDbClient")
-    def test_qc_curation_metric_skipped(self, mock_client_class):
+    @patch("zombie_squirrel.acorn_helpers.qc.acorns.get_metadata_client")
+    def test_qc_curation_metric_skipped(self, mock_get_client):
         """Test that curation metrics are filtered out."""
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
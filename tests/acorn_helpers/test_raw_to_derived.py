@@ -1,7 +1,7 @@
 """Unit tests for raw_to_derived helper."""
 
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 
@@ -151,6 +151,26 @@ class TestRawToDerived(unittest.TestCase):
 
         self.assertEqual(result, [])
 
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
+    def test_records_without_source_data_stay_comparable(self, mock_tree, mock_get_client):
+        """Test derived records lacking source data are stored as "" and skipped by the lookup."""
+        mock_tree.scurry.return_value = pd.DataFrame()
+        mock_client_instance = MagicMock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.retrieve_docdb_records.return_value = [
+            {"name": "derived_a_2026-01-02_00-00-00", "processing": {"pipelines": [{"name": None}]}},
+            {"name": "derived_b_2026-01-03_00-00-00", "data_description": {"source_data": [None, "raw_x"]}},
+        ]
+
+        result = raw_to_derived("raw_x", force_update=True)
+
+        self.assertEqual(result, ["derived_b_2026-01-03_00-00-00"])
+        stored = mock_tree.hide.call_args[0][1]
+        self.assertFalse(stored.isna().any().any())
+        self.assertListEqual(stored["source_data"].tolist(), ["", "", "raw_x"])
+        self.assertEqual(stored.iloc[0]["pipeline_name"], "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,9 +13,9 @@ from zombie_squirrel.acorn_helpers.source_data import source_data
 class TestSourceData(unittest.TestCase):
     """Tests for source_data acorn."""
 
-    @patch("zombie_squirrel.acorn_helpers.source_data.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
-    def test_source_data_cache_hit(self, mock_tree, mock_client_class):
+    def test_source_data_cache_hit(self, mock_tree, mock_get_client):
         """Test returning cached source data."""
         cached_df = pd.DataFrame(
             {
@@ -31,7 +31,7 @@ class TestSourceData(unittest.TestCase):
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result.iloc[0]["source_data"], "raw1")
-        mock_client_class.assert_not_called()
+        mock_get_client.assert_not_called()
 
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
     def test_source_data_empty_cache_raises_error(self, mock_tree):
@@ -44,13 +44,13 @@ class TestSourceData(unittest.TestCase):
         self.assertIn("Cache is empty", str(context.exception))
         self.assertIn("force_update=True", str(context.exception))
 
-    @patch("zombie_squirrel.acorn_helpers.source_data.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
-    def test_source_data_cache_miss(self, mock_tree, mock_client_class):
+    def test_source_data_cache_miss(self, mock_tree, mock_get_client):
         """Test fetching source data when cache is empty using real test records."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         resources_path = Path(__file__).parent.parent / "resources"
         with open(resources_path / "v2_derived.json") as f:
@@ -72,13 +72,13 @@ class TestSourceData(unittest.TestCase):
         self.assertIn(expected_source, row["source_data"].values)
         self.assertEqual(row.iloc[0]["processing_time"], "2026-02-14_12-44-45")
 
-    @patch("zombie_squirrel.acorn_helpers.source_data.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
-    def test_source_data_multiple_sources(self, mock_tree, mock_client_class):
+    def test_source_data_multiple_sources(self, mock_tree, mock_get_client):
         """Test derived asset with multiple source data entries produces one row each."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "name": "subject_2026-01-01_00-00-00_processed_2026-01-02_12-00-00",
@@ -93,14 +93,16 @@ class TestSourceData(unittest.TestCase):
         self.assertSetEqual(set(result["source_data"].tolist()), {"src1", "src2"})
         self.assertTrue((result["pipeline_name"] == "my_pipeline").all())
         self.assertTrue((result["processing_time"] == "2026-01-02_12-00-00").all())
+        for column in result.columns:
+            self.assertEqual(result[column].dtype, "string[pyarrow]")
 
-    @patch("zombie_squirrel.acorn_helpers.source_data.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
-    def test_source_data_no_source_data(self, mock_tree, mock_client_class):
+    def test_source_data_no_source_data(self, mock_tree, mock_get_client):
         """Test derived asset with no source data produces one row with empty source_data."""
         mock_tree.scurry.return_value = pd.DataFrame()
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "name": "derived_2026-01-01_00-00-00",
@@ -115,9 +117,9 @@ class TestSourceData(unittest.TestCase):
         self.assertEqual(result.iloc[0]["source_data"], "")
         self.assertEqual(result.iloc[0]["pipeline_name"], "")
 
-    @patch("zombie_squirrel.acorn_helpers.source_data.MetadataDbClient")
+    @patch("zombie_squirrel.acorn_helpers.source_data.acorns.get_metadata_client")
     @patch("zombie_squirrel.acorn_helpers.source_data.acorns.TREE")
-    def test_source_data_force_update(self, mock_tree, mock_client_class):
+    def test_source_data_force_update(self, mock_tree, mock_get_client):
         """Test force_update bypasses cache."""
         cached_df = pd.DataFrame(
             {
@@ -130,7 +132,7 @@ class TestSourceData(unittest.TestCase):
         mock_tree.scurry.return_value = cached_df
 
         mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
         mock_client_instance.retrieve_docdb_records.return_value = [
             {
                 "name": "new_derived_2026-01-01_12-00-00",
@@ -4,10 +4,13 @@ Tests for acorn registration and NAMES dictionary.
 """
 
 import unittest
+from unittest.mock import patch
 
 from zombie_squirrel.acorns import (
     ACORN_REGISTRY,
+    API_GATEWAY_HOST,
     NAMES,
+    get_metadata_client,
 )
 
 
@@ -34,5 +37,30 @@ class TestAcornRegistration(unittest.TestCase):
             self.assertIn(key, NAMES)
 
 
+class TestGetMetadataClient(unittest.TestCase):
+    """Tests for the shared metadata client factory."""
+
+    def setUp(self):
+        """Clear cached clients between tests."""
+        get_metadata_client.cache_clear()
+
+    def tearDown(self):
+        """Drop any mocked clients from the cache."""
+        get_metadata_client.cache_clear()
+
+    @patch("aind_data_access_api.document_db.MetadataDbClient")
+    def test_client_reused_per_version(self, mock_client_class):
+        """Test that repeated calls reuse one client per API version."""
+        first = get_metadata_client()
+        second = get_metadata_client()
+        v1 = get_metadata_client("v1")
+
+        self.assertIs(first, second)
+        self.assertEqual(mock_client_class.call_count, 2)
+        mock_client_class.assert_any_call(host=API_GATEWAY_HOST, version="v2")
+        mock_client_class.assert_any_call(host=API_GATEWAY_HOST, version="v1")
+        self.assertIsNotNone(v1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -22,6 +22,13 @@ class TestMemoryTreeGetLocation(unittest.TestCase):
         self.assertIn("test.json", tree._json_store)
         self.assertEqual(tree._json_store["test.json"], '{"key": "value"}')
 
+    def test_memory_tree_fetch(self):
+        """Test MemoryTree.fetch returns planted data, or an empty JSON object if missing."""
+        tree = MemoryTree()
+        tree.plant("test.json", '{"key": "value"}')
+        self.assertEqual(tree.fetch("test.json"), '{"key": "value"}')
+        self.assertEqual(tree.fetch("missing.json"), "{}")
+
 
 class TestS3TreeGetLocation(unittest.TestCase):
     """Tests for S3Tree.get_location method."""
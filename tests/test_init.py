@@ -0,0 +1,33 @@
+"""Unit tests for the zombie_squirrel package namespace.
+
+Tests for the names exported by the top-level package.
+"""
+
+import subprocess
+import sys
+import unittest
+
+import zombie_squirrel
+
+
+class TestPackageExports(unittest.TestCase):
+    """Tests for the public names in zombie_squirrel/__init__.py."""
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ is importable."""
+        for name in zombie_squirrel.__all__:
+            self.assertTrue(callable(getattr(zombie_squirrel, name)), name)
+
+    def test_import_populates_registry(self):
+        """Test that a bare package import registers every acorn."""
+        code = (
+            "import zombie_squirrel, zombie_squirrel.acorns as a; "
+            "missing = set(a.NAMES.values()) - set(a.ACORN_REGISTRY) - {a.NAMES['r2d']}; "
+            "print(sorted(missing))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
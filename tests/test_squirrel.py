@@ -209,8 +209,9 @@ class TestColumnsHelpers(unittest.TestCase):
         cols = qc_columns()
         self.assertIsInstance(cols, list)
         names = [c.name for c in cols]
-        for expected in ("name", "stage", "status", "asset_name"):
+        for expected in ("name", "stage", "asset_name", "subject_id", "timestamp"):
             self.assertIn(expected, names)
+        self.assertNotIn("status", names)
 
 
 if __name__ == "__main__":
@@ -1,29 +1,35 @@
 """Unit tests for zombie_squirrel.sync module."""
 
 import json
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, call, patch
 
 import pandas as pd
 
-from zombie_squirrel.sync import hide_acorns, publish_squirrel_metadata
+from zombie_squirrel.sync import QC_MAX_WORKERS, hide_acorns, publish_squirrel_metadata
+
+
+def _make_registry(
+    mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc, mock_smartspim=None, mock_upgrade=None
+):
+    """Create mock acorn registry dict."""
+    return {
+        "unique_project_names": mock_upn,
+        "unique_subject_ids": mock_usi,
+        "asset_basics": mock_basics,
+        "source_data": mock_d2r,
+        "raw_to_derived": mock_r2d,
+        "quality_control": mock_qc,
+        "assets_smartspim": mock_smartspim or MagicMock(),
+        "metadata_upgrade": mock_upgrade or MagicMock(),
+    }
 
 
 class TestHideAcorns(unittest.TestCase):
     """Test hide_acorns function."""
 
-    def _make_registry(self, mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc, mock_smartspim):
-        """Create mock acorn registry dict."""
-        return {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": mock_smartspim,
-        }
-
     @patch("zombie_squirrel.sync.publish_squirrel_metadata")
     @patch("zombie_squirrel.sync.ACORN_REGISTRY")
     def test_all_acorns_called_with_force_update(self, mock_registry, mock_publish):
@@ -36,7 +42,7 @@ class TestHideAcorns(unittest.TestCase):
         mock_r2d = MagicMock()
         mock_qc = MagicMock()
         mock_smartspim = MagicMock()
-        mock_registry.__getitem__.side_effect = self._make_registry(
+        mock_registry.__getitem__.side_effect = _make_registry(
             mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc, mock_smartspim
         ).__getitem__
 
@@ -56,7 +62,7 @@ class TestHideAcorns(unittest.TestCase):
         df_basics = pd.DataFrame({"subject_id": ["sub1", "sub2", None]})
         mock_basics = MagicMock(return_value=df_basics)
         mock_qc = MagicMock()
-        mock_registry.__getitem__.side_effect = self._make_registry(
+        mock_registry.__getitem__.side_effect = _make_registry(
             MagicMock(), MagicMock(), mock_basics, MagicMock(), MagicMock(), mock_qc, MagicMock()
         ).__getitem__
 
@@ -78,7 +84,7 @@ class TestHideAcorns(unittest.TestCase):
         df_basics = pd.DataFrame({"subject_id": [None, None]})
         mock_basics = MagicMock(return_value=df_basics)
         mock_qc = MagicMock()
-        mock_registry.__getitem__.side_effect = self._make_registry(
+        mock_registry.__getitem__.side_effect = _make_registry(
             MagicMock(), MagicMock(), mock_basics, MagicMock(), MagicMock(), mock_qc, MagicMock()
         ).__getitem__
 
@@ -92,7 +98,7 @@ class TestHideAcorns(unittest.TestCase):
         """Test publish_squirrel_metadata called after acorns processed."""
         df_basics = pd.DataFrame({"subject_id": ["sub1"]})
         mock_basics = MagicMock(return_value=df_basics)
-        mock_registry.__getitem__.side_effect = self._make_registry(
+        mock_registry.__getitem__.side_effect = _make_registry(
             MagicMock(), MagicMock(), mock_basics, MagicMock(), MagicMock(), MagicMock(), MagicMock()
         ).__getitem__
 
@@ -105,7 +111,7 @@ class TestHideAcorns(unittest.TestCase):
     def test_exception_from_acorn_propagates(self, mock_registry, mock_publish):
         """Test exceptions from acorns propagate to caller."""
         mock_upn = MagicMock(side_effect=Exception("Update failed"))
-        mock_registry.__getitem__.side_effect = self._make_registry(
+        mock_registry.__getitem__.side_effect = _make_registry(
             mock_upn, MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock(), MagicMock()
         ).__getitem__
 
@@ -114,6 +120,59 @@ class TestHideAcorns(unittest.TestCase):
 
         self.assertEqual(str(ctx.exception), "Update failed")
 
+    @patch("zombie_squirrel.sync.publish_squirrel_metadata")
+    @patch("zombie_squirrel.sync.ACORN_REGISTRY")
+    def test_independent_acorns_refresh_concurrently(self, mock_registry, mock_publish):
+        """Test upn and usi refreshes overlap instead of running back to back."""
+        usi_started = threading.Event()
+        mock_upn = MagicMock(side_effect=lambda force_update: self.assertTrue(usi_started.wait(timeout=5)))
+        mock_usi = MagicMock(side_effect=lambda force_update: usi_started.set())
+        mock_basics = MagicMock(return_value=pd.DataFrame({"subject_id": []}))
+        mock_smartspim = MagicMock()
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, MagicMock(), MagicMock(), MagicMock(), mock_smartspim
+        ).__getitem__
+
+        hide_acorns()
+
+        mock_upn.assert_called_once_with(force_update=True)
+        mock_smartspim.assert_called_once_with(force_update=True)
+
+    @patch("zombie_squirrel.sync.publish_squirrel_metadata")
+    @patch("zombie_squirrel.sync.ACORN_REGISTRY")
+    def test_upgrade_starts_after_basics_finishes(self, mock_registry, mock_publish):
+        """Test metadata_upgrade only runs once asset_basics has been rebuilt."""
+        upgrade_started = threading.Event()
+
+        def refresh_basics(force_update):
+            # An upgrade scheduled alongside basics would start during this wait
+            self.assertFalse(upgrade_started.wait(timeout=0.2))
+            return pd.DataFrame({"subject_id": []})
+
+        mock_basics = MagicMock(side_effect=refresh_basics)
+        mock_upgrade = MagicMock(side_effect=lambda force_update: upgrade_started.set())
+        mock_registry.__getitem__.side_effect = _make_registry(
+            MagicMock(), MagicMock(), mock_basics, MagicMock(), MagicMock(), MagicMock(), mock_upgrade=mock_upgrade
+        ).__getitem__
+
+        hide_acorns()
+
+        mock_upgrade.assert_called_once_with(force_update=True)
+
+    @patch("zombie_squirrel.sync.publish_squirrel_metadata")
+    @patch("zombie_squirrel.sync.ACORN_REGISTRY")
+    def test_qc_workers_bounded(self, mock_registry, mock_publish):
+        """Test the QC fan-out caps its worker count for large subject lists."""
+        mock_basics = MagicMock(return_value=pd.DataFrame({"subject_id": [f"sub{i}" for i in range(1000)]}))
+        mock_registry.__getitem__.side_effect = _make_registry(
+            MagicMock(), MagicMock(), mock_basics, MagicMock(), MagicMock(), MagicMock(), MagicMock()
+        ).__getitem__
+
+        with patch("zombie_squirrel.sync.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool:
+            hide_acorns()
+
+        self.assertEqual(mock_pool.call_args_list[-1].kwargs["max_workers"], QC_MAX_WORKERS)
+
 
 class TestPublishSquirrelMetadata(unittest.TestCase):
     """Test publish_squirrel_metadata function."""
@@ -130,15 +189,15 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         self.assertEqual(key, "squirrel.json")
 
     @patch("zombie_squirrel.sync.TREE")
-    def test_published_json_contains_six_acorns(self, mock_tree):
-        """Test published JSON contains six acorns."""
+    def test_published_json_contains_seven_acorns(self, mock_tree):
+        """Test published JSON contains seven acorns."""
         mock_tree.get_location.return_value = "s3://bucket/path"
 
         publish_squirrel_metadata()
 
         payload = json.loads(mock_tree.plant.call_args[0][1])
         self.assertIn("acorns", payload)
-        self.assertEqual(len(payload["acorns"]), 6)
+        self.assertEqual(len(payload["acorns"]), 7)
 
     @patch("zombie_squirrel.sync.TREE")
     def test_published_json_acorn_names(self, mock_tree):
@@ -155,6 +214,7 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         self.assertIn("source_data", names)
         self.assertIn("quality_control", names)
         self.assertIn("assets_smartspim", names)
+        self.assertIn("metadata_upgrade", names)
 
     @patch("zombie_squirrel.sync.TREE")
     def test_qc_acorn_is_partitioned(self, mock_tree):
@@ -189,7 +249,7 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
 
         publish_squirrel_metadata()
 
-        self.assertEqual(mock_tree.get_location.call_count, 6)
+        self.assertEqual(mock_tree.get_location.call_count, 7)
 
     @patch("zombie_squirrel.sync.TREE")
     def test_qc_location_uses_partitioned_flag(self, mock_tree):
@@ -229,15 +289,9 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         mock_basics.return_value = mock_df
 
         mock_smartspim = MagicMock()
-        mock_registry.__getitem__.side_effect = lambda x: {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": mock_smartspim,
-        }[x]
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc, mock_smartspim
+        ).__getitem__
 
         mock_tree.get_location.return_value = "s3://test-bucket/test"
 
@@ -266,15 +320,9 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         mock_df = pd.DataFrame({"subject_id": []})
         mock_basics.return_value = mock_df
 
-        mock_registry.__getitem__.side_effect = lambda x: {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": MagicMock(),
-        }[x]
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc
+        ).__getitem__
 
         mock_tree.get_location.return_value = "s3://test-bucket/test"
 
@@ -301,15 +349,9 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         mock_df = pd.DataFrame({"subject_id": ["subject1"]})
         mock_basics.return_value = mock_df
 
-        mock_registry.__getitem__.side_effect = lambda x: {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": MagicMock(),
-        }[x]
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc
+        ).__getitem__
 
         mock_tree.get_location.return_value = "s3://test-bucket/test"
 
@@ -332,15 +374,9 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         mock_df = pd.DataFrame({"subject_id": ["sub1", "sub2", "sub3", "sub4", "sub5"]})
         mock_basics.return_value = mock_df
 
-        mock_registry.__getitem__.side_effect = lambda x: {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": MagicMock(),
-        }[x]
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc
+        ).__getitem__
 
         mock_tree.get_location.return_value = "s3://test-bucket/test"
 
@@ -360,15 +396,9 @@ class TestPublishSquirrelMetadata(unittest.TestCase):
         mock_r2d = MagicMock()
         mock_qc = MagicMock()
 
-        mock_registry.__getitem__.side_effect = lambda x: {
-            "unique_project_names": mock_upn,
-            "unique_subject_ids": mock_usi,
-            "asset_basics": mock_basics,
-            "source_data": mock_d2r,
-            "raw_to_derived": mock_r2d,
-            "quality_control": mock_qc,
-            "assets_smartspim": MagicMock(),
-        }[x]
+        mock_registry.__getitem__.side_effect = _make_registry(
+            mock_upn, mock_usi, mock_basics, mock_d2r, mock_r2d, mock_qc
+        ).__getitem__
 
         with self.assertRaises(Exception) as context:
             hide_acorns()
@@ -4,15 +4,23 @@ Tests for abstract base class, memory backend, and S3 backend
 for caching functionality.
 """
 
+import io
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
+import pyarrow.parquet as pq
 
 from zombie_squirrel.forest import (
+    S3_CLIENT_CONFIG,
+    TRANSFER_CONFIG,
     MemoryTree,
     S3Tree,
     Tree,
+    _duckdb_connection,
+    _duckdb_query,
 )
 
 
@@ -105,6 +113,16 @@ class TestMemoryTree(unittest.TestCase):
         retrieved = self.tree.scurry("empty_table")
         pd.testing.assert_frame_equal(df, retrieved)
 
+    def test_scurry_columns(self):
+        """Test scurrying with columns returns only the requested columns."""
+        df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+        self.tree.hide("test_table", df)
+
+        result = self.tree.scurry("test_table", columns=["col2"])
+
+        self.assertListEqual(list(result.columns), ["col2"])
+        self.assertListEqual(result["col2"].tolist(), ["a", "b"])
+
     def test_scurry_multiple_tables(self):
         """Test scurrying multiple tables merges them with asset_name."""
         df1 = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
@@ -120,6 +138,26 @@ class TestMemoryTree(unittest.TestCase):
         self.assertEqual(result[result["col1"] == 1].iloc[0]["asset_name"], "table1")
         self.assertEqual(result[result["col1"] == 3].iloc[0]["asset_name"], "table2")
 
+    def test_scurry_multiple_tables_with_columns(self):
+        """Test scurrying multiple tables with a column subset keeps asset_name."""
+        self.tree.hide("table1", pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}))
+        self.tree.hide("table2", pd.DataFrame({"col1": [3, 4], "col2": ["c", "d"]}))
+
+        result = self.tree.scurry(["table1", "table2"], columns=["col2"])
+
+        self.assertListEqual(list(result.columns), ["col2", "asset_name"])
+        self.assertListEqual(result["col2"].tolist(), ["a", "b", "c", "d"])
+
+    def test_scurry_multiple_leaves_stored_tables_untouched(self):
+        """Test merging tables doesn't add asset_name to the stored DataFrames."""
+        df1 = pd.DataFrame({"col1": [1, 2]})
+        self.tree.hide("table1", df1)
+
+        self.tree.scurry(["table1"])
+
+        self.assertListEqual(list(df1.columns), ["col1"])
+        self.assertListEqual(list(self.tree.scurry("table1").columns), ["col1"])
+
     def test_scurry_multiple_with_missing_table(self):
         """Test scurrying multiple tables where some don't exist."""
         df1 = pd.DataFrame({"col1": [1, 2]})
@@ -150,9 +188,28 @@ class TestS3Tree(unittest.TestCase):
 
         acorn = S3Tree()
 
+        mock_boto3_client.assert_not_called()
         self.assertEqual(acorn.bucket, "allen-data-views")
         self.assertEqual(acorn.s3_client, mock_s3_client)
-        mock_boto3_client.assert_called_once_with("s3")
+        self.assertIs(acorn.s3_client, mock_s3_client)
+        mock_boto3_client.assert_called_once_with("s3", config=S3_CLIENT_CONFIG)
+
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_client_created_once_across_threads(self, mock_boto3_client):
+        """Test concurrent first access to S3Tree.s3_client builds a single client."""
+
+        def slow_client(*args, **kwargs):
+            time.sleep(0.01)
+            return MagicMock()
+
+        mock_boto3_client.side_effect = slow_client
+        acorn = S3Tree()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = list(executor.map(lambda _: acorn.s3_client, range(8)))
+
+        mock_boto3_client.assert_called_once_with("s3", config=S3_CLIENT_CONFIG)
+        self.assertTrue(all(client is clients[0] for client in clients))
 
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_hide(self, mock_boto3_client):
@@ -165,17 +222,43 @@ class TestS3Tree(unittest.TestCase):
 
         acorn.hide("test_table", df)
 
-        self.assertEqual(mock_s3_client.put_object.call_count, 2)
-
-        parquet_call = mock_s3_client.put_object.call_args_list[0][1]
-        self.assertEqual(parquet_call["Bucket"], "allen-data-views")
-        self.assertEqual(parquet_call["Key"], "data-asset-cache/zs_test_table.pqt")
-        self.assertIsInstance(parquet_call["Body"], bytes)
-
-        json_call = mock_s3_client.put_object.call_args_list[1][1]
+        mock_s3_client.upload_fileobj.assert_called_once()
+        buffer, bucket, key = mock_s3_client.upload_fileobj.call_args[0]
+        self.assertEqual(bucket, "allen-data-views")
+        self.assertEqual(key, "data-asset-cache/zs_test_table.pqt")
+        self.assertIs(mock_s3_client.upload_fileobj.call_args.kwargs["Config"], TRANSFER_CONFIG)
+        parquet_meta = pq.ParquetFile(io.BytesIO(buffer.getvalue())).metadata
+        self.assertEqual(parquet_meta.row_group(0).column(0).compression, "ZSTD")
+        self.assertIn("RLE_DICTIONARY", parquet_meta.row_group(0).column(0).encodings)
+
+        self.assertEqual(mock_s3_client.put_object.call_count, 1)
+        json_call = mock_s3_client.put_object.call_args_list[0][1]
         self.assertEqual(json_call["Bucket"], "allen-data-views")
         self.assertEqual(json_call["Key"], "data-asset-cache/zs_test_table.json")
-        self.assertIn("columns", json_call["Body"])
+        self.assertEqual(json_call["Body"], '{"columns":["col1"]}')
+
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_hide_uploads_sidecar_after_parquet(self, mock_boto3_client):
+        """Test S3Tree.hide writes the JSON sidecar once the parquet upload has finished."""
+        mock_s3_client = MagicMock()
+        mock_boto3_client.return_value = mock_s3_client
+
+        S3Tree().hide("test_table", pd.DataFrame({"col1": [1, 2, 3]}))
+
+        calls = [name for name, _, _ in mock_s3_client.mock_calls if name in ("upload_fileobj", "put_object")]
+        self.assertListEqual(calls, ["upload_fileobj", "put_object"])
+
+    @patch("zombie_squirrel.forest.ROW_GROUP_SIZE", 2)
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_hide_row_groups(self, mock_boto3_client):
+        """Test S3Tree.hide splits the parquet file into ROW_GROUP_SIZE row groups."""
+        mock_s3_client = MagicMock()
+        mock_boto3_client.return_value = mock_s3_client
+
+        S3Tree().hide("test_table", pd.DataFrame({"col1": [1, 2, 3]}))
+
+        buffer = mock_s3_client.upload_fileobj.call_args[0][0]
+        self.assertEqual(pq.ParquetFile(io.BytesIO(buffer.getvalue())).metadata.num_row_groups, 2)
 
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_hide_qc_metadata(self, mock_boto3_client):
@@ -188,15 +271,26 @@ class TestS3Tree(unittest.TestCase):
 
         acorn.hide("qc/subject123", df)
 
-        self.assertEqual(mock_s3_client.put_object.call_count, 2)
+        self.assertEqual(mock_s3_client.put_object.call_count, 1)
 
-        json_call = mock_s3_client.put_object.call_args_list[1][1]
+        json_call = mock_s3_client.put_object.call_args_list[0][1]
         self.assertEqual(json_call["Bucket"], "allen-data-views")
         self.assertEqual(json_call["Key"], "data-asset-cache/zs_qc.json")
         self.assertIn("columns", json_call["Body"])
         self.assertIn("metric", json_call["Body"])
 
-    @patch("zombie_squirrel.forest.duckdb.query")
+    def test_duckdb_connection_is_shared(self):
+        """Test DuckDB queries reuse one connection instead of reconnecting per read."""
+        self.assertIs(_duckdb_connection(), _duckdb_connection())
+        result = _duckdb_query("SELECT 42 AS answer").to_df()
+        self.assertEqual(result["answer"].tolist(), [42])
+
+    def test_duckdb_query_binds_named_params(self):
+        """Test values are bound as params rather than spliced into the SQL."""
+        result = _duckdb_query("SELECT $name AS name", params={"name": "it's"}).to_df()
+        self.assertEqual(result["name"].tolist(), ["it's"])
+
+    @patch("zombie_squirrel.forest._duckdb_query")
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_scurry(self, mock_boto3_client, mock_duckdb_query):
         """Test S3Tree.scurry method reads from S3 using DuckDB."""
@@ -214,13 +308,30 @@ class TestS3Tree(unittest.TestCase):
         # Verify DuckDB was called with correct S3 path
         mock_duckdb_query.assert_called_once()
         query_call = mock_duckdb_query.call_args[0][0]
-        self.assertIn(
-            "s3://allen-data-views/data-asset-cache/zs_test_table.pqt",
-            query_call,
+        self.assertIn("read_parquet($path)", query_call)
+        self.assertEqual(
+            mock_duckdb_query.call_args.kwargs["params"],
+            {"path": "s3://allen-data-views/data-asset-cache/zs_test_table.pqt"},
         )
         pd.testing.assert_frame_equal(result, expected_df)
 
-    @patch("zombie_squirrel.forest.duckdb.query")
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_columns(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree.scurry selects only the requested columns."""
+        mock_boto3_client.return_value = MagicMock()
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col1": [1]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        acorn.scurry("test_table", columns=["col1", "col2"])
+
+        query_call = mock_duckdb_query.call_args[0][0]
+        self.assertIn('SELECT "col1", "col2" FROM', query_call)
+        self.assertNotIn("SELECT *", query_call)
+
+    @patch("zombie_squirrel.forest._duckdb_query")
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_scurry_handles_error(self, mock_boto3_client, mock_duckdb_query):
         """Test S3Tree.scurry returns empty DataFrame on error."""
@@ -234,7 +345,7 @@ class TestS3Tree(unittest.TestCase):
         self.assertTrue(result.empty)
         self.assertIsInstance(result, pd.DataFrame)
 
-    @patch("zombie_squirrel.forest.duckdb.query")
+    @patch("zombie_squirrel.forest._duckdb_query")
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_scurry_multiple_tables(self, mock_boto3_client, mock_duckdb_query):
         """Test S3Tree.scurry merges multiple tables with DuckDB."""
@@ -253,12 +364,37 @@ class TestS3Tree(unittest.TestCase):
 
         mock_duckdb_query.assert_called_once()
         query_call = mock_duckdb_query.call_args[0][0]
-        self.assertIn("UNION ALL", query_call)
-        self.assertIn("'table1' as asset_name", query_call)
-        self.assertIn("'table2' as asset_name", query_call)
+        self.assertNotIn("UNION ALL", query_call)
+        self.assertIn("read_parquet($paths, filename=true)", query_call)
+        self.assertEqual(
+            mock_duckdb_query.call_args.kwargs["params"],
+            {
+                "paths": [
+                    "s3://allen-data-views/data-asset-cache/zs_table1.pqt",
+                    "s3://allen-data-views/data-asset-cache/zs_table2.pqt",
+                ],
+                "assets": ["table1", "table2"],
+            },
+        )
         pd.testing.assert_frame_equal(result, expected_df)
 
-    @patch("zombie_squirrel.forest.duckdb.query")
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_multiple_tables_with_columns(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree.scurry selects only the requested columns from each table."""
+        mock_boto3_client.return_value = MagicMock()
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col2": ["a", "c"], "asset_name": ["table1", "table2"]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        acorn.scurry(["table1", "table2"], columns=["col2"])
+
+        query_call = mock_duckdb_query.call_args[0][0]
+        self.assertIn('SELECT "col2", list_extract', query_call)
+        self.assertNotIn("SELECT *", query_call)
+
+    @patch("zombie_squirrel.forest._duckdb_query")
     @patch("zombie_squirrel.forest.boto3.client")
     def test_s3_scurry_multiple_handles_error(self, mock_boto3_client, mock_duckdb_query):
         """Test S3Tree.scurry multiple tables handles errors."""
@@ -272,6 +408,85 @@ class TestS3Tree(unittest.TestCase):
         self.assertTrue(result.empty)
         self.assertIsInstance(result, pd.DataFrame)
 
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_memo_hit(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree.scurry reuses the previous read while the ETag is unchanged."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.head_object.return_value = {"ETag": '"abc"'}
+        mock_boto3_client.return_value = mock_s3_client
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col1": [1, 2, 3]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        first = acorn.scurry("test_table")
+        first["col1"] = 0
+        with self.assertLogs(level="DEBUG") as logs:
+            second = acorn.scurry("test_table")
+
+        mock_duckdb_query.assert_called_once()
+        self.assertIn("memo hit", logs.output[0])
+        self.assertListEqual(second["col1"].tolist(), [1, 2, 3])
+
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_memo_invalidated(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree.scurry re-reads when the ETag changes or the table is rewritten."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.head_object.side_effect = [{"ETag": '"abc"'}, {"ETag": '"def"'}, {"ETag": '"def"'}]
+        mock_boto3_client.return_value = mock_s3_client
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col1": [1]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        acorn.scurry("test_table")
+        acorn.scurry("test_table")
+        acorn.hide("test_table", pd.DataFrame({"col1": [2]}))
+        acorn.scurry("test_table")
+
+        self.assertEqual(mock_duckdb_query.call_count, 3)
+
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_reads_when_head_fails(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree.scurry still reads the table, unmemoized, when the ETag HEAD fails."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.head_object.side_effect = Exception("AccessDenied")
+        mock_boto3_client.return_value = mock_s3_client
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col1": [1, 2, 3]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        first = acorn.scurry("test_table")
+        second = acorn.scurry("test_table")
+
+        self.assertListEqual(first["col1"].tolist(), [1, 2, 3])
+        self.assertListEqual(second["col1"].tolist(), [1, 2, 3])
+        self.assertEqual(mock_duckdb_query.call_count, 2)
+        self.assertEqual(len(acorn._memo), 0)
+
+    @patch("zombie_squirrel.forest.MEMO_SIZE", 1)
+    @patch("zombie_squirrel.forest._duckdb_query")
+    @patch("zombie_squirrel.forest.boto3.client")
+    def test_s3_scurry_memo_evicts_oldest(self, mock_boto3_client, mock_duckdb_query):
+        """Test S3Tree keeps at most MEMO_SIZE tables memoized."""
+        mock_s3_client = MagicMock()
+        mock_s3_client.head_object.return_value = {"ETag": '"abc"'}
+        mock_boto3_client.return_value = mock_s3_client
+        mock_result = MagicMock()
+        mock_result.to_df.return_value = pd.DataFrame({"col1": [1]})
+        mock_duckdb_query.return_value = mock_result
+
+        acorn = S3Tree()
+        acorn.scurry("table1")
+        acorn.scurry("table2")
+        acorn.scurry("table1")
+
+        self.assertEqual(mock_duckdb_query.call_count, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,8 +4,11 @@ Tests for utility functions.
 """
 
 import unittest
+from unittest.mock import patch
 
-from zombie_squirrel.utils import get_s3_cache_path, prefix_table_name
+from zombie_squirrel.forest import MemoryTree
+from zombie_squirrel.squirrel import Squirrel
+from zombie_squirrel.utils import get_s3_cache_path, get_squirrel_info, prefix_table_name
 
 
 class TestPrefixTableName(unittest.TestCase):
@@ -51,5 +54,20 @@ class TestGetS3CachePath(unittest.TestCase):
         self.assertEqual(result, "data-asset-cache/zs_my_data.pqt")
 
 
+class TestGetSquirrelInfo(unittest.TestCase):
+    """Tests for the get_squirrel_info function."""
+
+    def test_get_squirrel_info_reads_planted_json(self):
+        """Test that get_squirrel_info parses squirrel.json from the active tree."""
+        tree = MemoryTree()
+        tree.plant("squirrel.json", '{"acorns": []}')
+
+        with patch("zombie_squirrel.acorns.TREE", tree):
+            info = get_squirrel_info()
+
+        self.assertIsInstance(info, Squirrel)
+        self.assertListEqual(info.acorns, [])
+
+
 if __name__ == "__main__":
     unittest.main()